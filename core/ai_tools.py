@@ -53,12 +53,8 @@ def _validate_priority(priority: int) -> bool:
 
 
 def _find_task_by_id(task_id: int) -> Optional[Task]:
-    """Find task by ID in AppState"""
-    state = _get_state()
-    for task in state.tasks:
-        if task.id == task_id:
-            return task
-    return None
+    """Find task by ID in AppState (uses the AppState id index)"""
+    return _get_state().get_task_by_id(task_id)
 
 
 def _save_tasks():
@@ -400,7 +396,7 @@ def complete_task(task_id: int) -> str:
             return f"ℹ️  Task #{task_id} is already marked as complete"
 
         # Mark as done
-        task.done = True
+        state.set_done(task, True)
         try:
             task.completed_at = datetime.now().isoformat()
         except Exception:
@@ -454,7 +450,7 @@ def uncomplete_task(task_id: int) -> str:
             return f"ℹ️  Task #{task_id} is already marked as incomplete"
 
         # Mark as not done
-        task.done = False
+        state.set_done(task, False)
         task.completed_at = ""
         state.invalidate_filter_cache()  # CRITICAL: Invalidate cache after state modification
         try:
@@ -6,6 +6,7 @@ from core.state import AppState
 from services.notes import FileNoteRepository
 from config import DEFAULT_NOTES_DIR, DEFAULT_EDITOR_CMD
 from utils.editor import open_in_editor
+import re
 import shlex
 from textwrap import dedent
 from datetime import datetime
@@ -57,6 +58,24 @@ COMMAND_ALIASES = {
 SHORTCUTS = COMMAND_ALIASES
 
 
+def route_add(app: Any) -> Any:
+    """
+    Dispatch 'add' to the action matching the app's entity_mode.
+
+    Notes mode opens the note editor; any other mode (including a missing
+    or invalid one) falls back to the task form.
+
+    Args:
+        app: Object exposing ``state``, ``action_new_note`` and ``action_add_task``
+
+    Returns:
+        Whatever the selected action returns
+    """
+    if getattr(app.state, 'entity_mode', 'tasks') == 'notes':
+        return app.action_new_note()
+    return app.action_add_task()
+
+
 def _log_state_snapshot(prefix: str, state: AppState) -> None:
     """
     Log current state snapshot for debugging.
@@ -124,6 +143,10 @@ def get_relative_time(iso_timestamp: str) -> str:
         return "Unknown"
 
 
+# Task ID token: single ID or inclusive range (e.g. "5", "1-5")
+_TASK_ID_RE = re.compile(r'(\d+)(?:-(\d+))?')
+
+
 def parse_task_ids(id_args: list[str]) -> list[int]:
     """
     Parse task IDs from arguments, supporting:
@@ -136,35 +159,44 @@ def parse_task_ids(id_args: list[str]) -> list[int]:
     for arg in id_args:
         # Handle comma-separated IDs
         for part in arg.replace(',', ' ').split():
-            # Handle ranges (e.g., 1-5)
-            if '-' in part:
-                try:
-                    start, end = part.split('-')
-                    start, end = int(start.strip()), int(end.strip())
-                    ids.update(range(start, end + 1))
-                except ValueError:
-                    continue  # Skip invalid ranges
+            # Single ID (5) or range (1-5); anything else is skipped
+            match = _TASK_ID_RE.fullmatch(part)
+            if match is None:
+                continue
+            start, end = match.groups()
+            if end is None:
+                ids.add(int(start))
             else:
-                # Single ID
-                try:
-                    ids.add(int(part.strip()))
-                except ValueError:
-                    continue  # Skip invalid IDs
-    return sorted(list(ids))
+                ids.update(range(int(start), int(end) + 1))
+    return sorted(ids)
+
+
+# Fast-path tokenizer for parse_command: input without quotes or backslashes
+# tokenizes exactly like shlex.split (POSIX mode) by splitting on its whitespace set.
+_SHLEX_SPECIAL_RE = re.compile(r'["\'\\]')
+_SHLEX_WHITESPACE_RE = re.compile(r'[ \t\r\n]+')
+
+
+def _split_command(command: str) -> list[str]:
+    """Tokenize a command line; falls back to shlex.split for quoted/escaped input."""
+    if _SHLEX_SPECIAL_RE.search(command):
+        return shlex.split(command)
+    return [p for p in _SHLEX_WHITESPACE_RE.split(command) if p]
 
 
 def parse_command(command: str, state: AppState, console: Any) -> Optional[tuple[str, list[str]]]:
-    parts = shlex.split(command.strip())
+    parts = _split_command(command.strip())
     if not parts:
         state.messages = []
         return None
     state.messages = []
 
-    # Expand shortcuts
+    # Expand shortcuts (single dict probe: alias -> canonical command)
     cmd = parts[0].lower()
-    if cmd in SHORTCUTS:
-        parts[0] = SHORTCUTS[cmd]
-        cmd = parts[0]
+    resolved = COMMAND_ALIASES.get(cmd)
+    if resolved is not None:
+        debug_log.debug(f"[COMMANDS] Alias '{cmd}' → '{resolved}'")
+        parts[0] = cmd = resolved
 
     if DEBUG_PARSER:
         state.messages.append(f"[debug] Parsed parts: {parts}")
@@ -285,7 +317,7 @@ def handle_done(command_arguments: list[str], state: AppState, console: Any) ->
         task = state.get_task_by_id(task_id)  # O(1) lookup instead of O(n)
         if task:
             debug_log.debug(f"[handle_done] Marking task {task_id} as done")
-            task.done = True
+            state.set_done(task, True)
             task.completed_at = datetime.now().isoformat()
             try:
                 task.updated_at = datetime.now().isoformat()
@@ -349,7 +381,7 @@ def handle_undone(command_arguments: list[str], state: AppState, console: Any) -
             except Exception:
                 pass
             debug_log.debug(f"[handle_undone] Unmarking task {task_id}")
-            task.done = False
+            state.set_done(task, False)
             task.completed_at = ""
             task.completed_at = ""  # Clear completion timestamp
             unmarked.append(task_id)
@@ -385,11 +417,7 @@ def handle_command(command: str, state: AppState, console: Any) -> None:
         debug_log.debug("[COMMANDS] Empty command, skipping")
         return
 
-    # Map command aliases to full commands
-    original_cmd = cmd
-    if cmd in COMMAND_ALIASES:
-        cmd = COMMAND_ALIASES[cmd]
-        debug_log.debug(f"[COMMANDS] Alias '{original_cmd}' → '{cmd}'")
+    # Aliases were already expanded by parse_command
 
     debug_log.info(f"[COMMANDS] Executing: {cmd} with {len(parts)-1} args")
 
@@ -533,6 +561,9 @@ def handle_command(command: str, state: AppState, console: Any) -> None:
                 debug_log.debug(f"[edit] Tags changed: {old_tags} → {task.tags}")
                 state._update_tag_index_for_task(task, old_tags)
 
+            # Name/priority/tags feed filters and sorting
+            state.invalidate_filter_cache()
+
             debug_log.info(f"[edit] Task {task_id} updated successfully")
             state.messages.append(f"[~] Task {task_id} updated")
         except Exception as e:
@@ -11,13 +11,103 @@ Features:
 
 import os
 import json
+import hashlib
 import shutil
+import dataclasses
 import tempfile
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, BinaryIO
 from pathlib import Path
 from typing import Any
 from utils.file_validators import validate_filename
 import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; stdlib json is used when orjson is not installed
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any], indent: Optional[int]) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Any truthy indent produces 2-space indentation (the only width orjson
+    supports); indent=None/0 produces compact output. The stdlib fallback
+    uses the same indent and separators, so both backends write identical
+    bytes.
+
+    Dataclass instances (e.g. Task) may be passed as-is: orjson encodes
+    them natively, which is far cheaper than dataclasses.asdict() per item.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(
+        data,
+        indent=2 if indent else None,
+        separators=None if indent else (',', ':'),
+        ensure_ascii=False,
+        default=_json_default,
+    ).encode('utf-8')
+
+
+def _json_default(obj: Any) -> Any:
+    """stdlib json fallback for dataclass instances (orjson handles them itself)."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(raw: bytes) -> Any:
+    """
+    Parse UTF-8 JSON bytes.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    catch json.JSONDecodeError for either backend.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json_stream(stream: BinaryIO, data: Any, indent: Optional[int] = 4) -> None:
+    """
+    Write JSON to an already-open binary stream (e.g. io.BytesIO).
+
+    Uses the same encoder as SafeFileManager, without atomic replace or
+    backups, which only make sense for files on disk.
+    """
+    stream.write(_dumps(data, indent))
+
+
+def read_json_stream(stream: BinaryIO) -> Any:
+    """Read JSON written by write_json_stream (or any UTF-8 JSON stream)."""
+    return _loads(stream.read())
+
+
+def _fsync_dir(path: str) -> None:
+    """
+    fsync a directory so a rename inside it survives a crash.
+
+    No-op where directories can't be opened (Windows has no O_DIRECTORY);
+    filesystems that reject directory fsync are ignored as well.
+    """
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 class FileSafetyError(Exception):
@@ -83,8 +173,29 @@ class SafeFileManager:
         self.lock_timeout = lock_timeout
         self.backup_count = backup_count
         self.console = console
+        # Backup paths are fixed for the manager's lifetime; build them once
+        # (slot 0 always exists so a save can back up even with backup_count=0)
+        backup_prefix = f"{self.filename}.backup"
+        self._backup_paths = [Path(backup_prefix)] + [
+            Path(f"{backup_prefix}.{i}") for i in range(1, max(backup_count, 1))
+        ]
+        # str forms for os.* calls, so hot paths skip Path.__fspath__;
+        # self.filename / _get_backup_path stay Path for the public API
+        self._filename_str = os.fspath(self.filename)
+        self._dir_str = os.fspath(self.filename.parent)
+        self._backup_strs = [os.fspath(p) for p in self._backup_paths]
         # Intra-process write lock to serialize saves
         self._write_lock: threading.Lock = threading.Lock()
+        # Coalesced saves: newest pending payload + background writer
+        self.coalesce_interval: float = 0.02
+        self._pending: Optional[tuple] = None
+        self._pending_cond = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_error: Optional[Exception] = None
+        # (len, blake2b digest, st_ino, st_mtime_ns, st_size) of the last
+        # save; lets an identical re-save skip the backup rotation and
+        # fsync'd write without keeping a copy of the payload
+        self._last_saved: Optional[tuple] = None
 
     def atomic_write_json(self, data: Dict[str, Any], indent: int = 4):
         """
@@ -94,6 +205,11 @@ class SafeFileManager:
         1. Write to temporary file in same directory
         2. Flush and fsync (force to disk)
         3. Atomic replace (one OS operation)
+        4. fsync the parent directory so the rename itself is durable
+           (POSIX only)
+
+        Only the temp file and the directory are fsynced; backup copies
+        are recovery data and are not forced to disk.
 
         This ensures the original file is never in an inconsistent state.
         If the process crashes during write, the temp file is abandoned
@@ -101,7 +217,26 @@ class SafeFileManager:
 
         Args:
             data: Dictionary to serialize as JSON
-            indent: JSON indentation (default 4)
+            indent: JSON indentation (default 4; orjson always indents
+                by 2 when indent is set)
+
+        Raises:
+            FileSafetyError: If write fails
+        """
+        self._atomic_write_bytes(self._encode(data, indent))
+
+    def _encode(self, data: Dict[str, Any], indent: Optional[int]) -> bytes:
+        """Serialize data straight to UTF-8 bytes (no str -> bytes encode step)."""
+        try:
+            return _dumps(data, indent)
+        except Exception as e:
+            raise FileSafetyError(f"Failed to write {self.filename}: {e}") from e
+
+    def _atomic_write_bytes(self, encoded: bytes):
+        """
+        Atomically replace the file with already-encoded bytes.
+
+        See atomic_write_json for the write/fsync/replace protocol.
 
         Raises:
             FileSafetyError: If write fails
@@ -110,45 +245,44 @@ class SafeFileManager:
         self.filename.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize to None for safe cleanup
-        temp = None
+        fd = None
         temp_path = None
 
         try:
             # Create temp file in SAME directory (critical for atomic replace)
             # Using same directory ensures temp file is on same filesystem,
             # which is required for atomic os.replace()
-            temp = tempfile.NamedTemporaryFile(
-                mode='w',
-                dir=self.filename.parent,
+            # mkstemp opens with O_EXCL and hands back a raw fd
+            fd, temp_path = tempfile.mkstemp(
+                dir=self._dir_str,
                 prefix=f'.{self.filename.name}.',
-                suffix='.tmp',
-                delete=False,
-                encoding='utf-8'
+                suffix='.tmp'
             )
-            temp_path = temp.name  # Save path early for cleanup
-
-            # Serialize to JSON
-            json_str = json.dumps(data, indent=indent, ensure_ascii=False)
 
-            # Write to temp file
-            temp.write(json_str)
-            temp.flush()
+            # Write the bytes with os.write (no BufferedWriter copy);
+            # loop because a single write may be short
+            view = memoryview(encoded)
+            while view:
+                view = view[os.write(fd, view):]
 
             # Force write to disk (important for networked filesystems)
             # This ensures data is physically written before we replace
-            os.fsync(temp.fileno())
-            temp.close()
+            os.fsync(fd)
+            os.close(fd)
+            fd = None
 
             # Atomic replace (one OS operation - never partial)
             # os.replace() is guaranteed atomic on all platforms (Python 3.3+)
-            os.replace(temp_path, self.filename)
+            os.replace(temp_path, self._filename_str)
+
+            # Persist the directory entry for the rename
+            _fsync_dir(self._dir_str)
 
         except Exception as e:
-            # SAFE CLEANUP: Check if temp exists before accessing
-            if temp is not None:
+            # SAFE CLEANUP: Close the fd if it is still open
+            if fd is not None:
                 try:
-                    if not temp.closed:
-                        temp.close()
+                    os.close(fd)
                 except Exception:
                     pass  # Ignore cleanup errors
 
@@ -177,11 +311,16 @@ class SafeFileManager:
             FileNotFoundError: If no file or backups exist
             FileCorruptionError: If all files corrupted
         """
-        # Try main file first
-        if self.filename.exists():
+        # Try main file first (EAFP: the read itself tells us if it exists)
+        main_exists = True
+        try:
+            with open(self._filename_str, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            main_exists = False
+        else:
             try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _loads(raw)
             except json.JSONDecodeError as e:
                 self.console.print(
                     f"[yellow]⚠️  Main file corrupted: {e}[/yellow]"
@@ -190,22 +329,25 @@ class SafeFileManager:
         # Try backups in order (newest to oldest)
         for i in range(self.backup_count):
             backup_path = self._get_backup_path(i)
-            if backup_path.exists():
-                try:
-                    with open(backup_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        self.console.print(
-                            f"[green]✓ Recovered from {backup_path.name}[/green]"
-                        )
-                        return data
-                except json.JSONDecodeError:
-                    self.console.print(
-                        f"[yellow]⚠️  Backup {backup_path.name} corrupted[/yellow]"
-                    )
-                    continue
+            try:
+                with open(self._backup_strs[i], 'rb') as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                continue
+            try:
+                data = _loads(raw)
+                self.console.print(
+                    f"[green]✓ Recovered from {backup_path.name}[/green]"
+                )
+                return data
+            except json.JSONDecodeError:
+                self.console.print(
+                    f"[yellow]⚠️  Backup {backup_path.name} corrupted[/yellow]"
+                )
+                continue
 
         # All files failed
-        if not self.filename.exists():
+        if not main_exists:
             raise FileNotFoundError(f"No file found: {self.filename}")
         else:
             raise FileCorruptionError(
@@ -222,8 +364,13 @@ class SafeFileManager:
         Save JSON data with backup and atomic replace.
 
         Process:
+        0. Encode the JSON before taking the write lock (pure CPU, so
+           concurrent savers encode in parallel); if it is byte-identical
+           to our last save and the file hasn't changed since, stop here
         1. Rotate existing backups
-        2. Create a backup copy of the current file (if it exists)
+        2. Create a backup of the current file (if it exists) as a hard
+           link - the following os.replace() gives the main name a new
+           inode, so the link keeps the old contents without copying them
         3. Atomically write the new JSON data to the main file
 
         Args:
@@ -235,16 +382,103 @@ class SafeFileManager:
             FileLockTimeoutError: If can't acquire lock
             FileSafetyError: If save fails
         """
+        # Encode outside the lock; unserializable data fails before any
+        # backup is touched
+        encoded = self._encode(data, indent)
+
         # Serialize writes within process
         with self._write_lock:
+            if self._is_unchanged(encoded):
+                return
+
             # Rotate and create backup if requested
-            if create_backup and self.filename.exists():
+            if create_backup and os.path.exists(self._filename_str):
                 self._rotate_backups()
-                backup_path = self._get_backup_path(0)
-                shutil.copy2(self.filename, backup_path)
+                backup_path = self._backup_strs[0]
+                try:
+                    os.link(self._filename_str, backup_path)
+                except OSError:
+                    # Filesystem without hard links (FAT, some network shares)
+                    shutil.copy2(self._filename_str, backup_path)
 
             # Atomic write ensures file replacement is safe
-            self.atomic_write_json(data, indent)
+            self._atomic_write_bytes(encoded)
+            st = os.stat(self._filename_str)
+            self._last_saved = (
+                len(encoded), hashlib.blake2b(encoded).digest(),
+                st.st_ino, st.st_mtime_ns, st.st_size,
+            )
+
+    def _is_unchanged(self, encoded: bytes) -> bool:
+        """True if the file still holds exactly what our last save wrote."""
+        last = self._last_saved
+        if last is None or last[0] != len(encoded):
+            return False
+        if last[1] != hashlib.blake2b(encoded).digest():
+            return False
+        try:
+            st = os.stat(self._filename_str)
+        except OSError:
+            return False
+        return (st.st_ino, st.st_mtime_ns, st.st_size) == last[2:]
+
+    def save_coalesced(
+        self,
+        data: Dict[str, Any],
+        indent: int = 4,
+        create_backup: bool = True
+    ):
+        """
+        Queue data for a background save; only the newest payload is written.
+
+        Calls arriving within coalesce_interval of each other replace the
+        pending payload instead of each doing their own write + fsync, so a
+        burst of N saves (e.g. UI autosave) costs one or two real writes.
+        Call flush() when the data must be on disk before continuing.
+
+        Args:
+            data: Dictionary to save
+            indent: JSON indentation
+            create_backup: Whether to create backup first
+        """
+        with self._pending_cond:
+            self._pending = (data, indent, create_backup)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._drain_pending,
+                    name=f"SafeFileManager-writer-{self.filename.name}",
+                    daemon=True
+                )
+                self._writer.start()
+
+    def flush(self):
+        """
+        Block until all coalesced saves have been written.
+
+        Raises:
+            FileSafetyError: If a background save failed
+        """
+        with self._pending_cond:
+            while self._writer is not None:
+                self._pending_cond.wait()
+            error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise error
+
+    def _drain_pending(self):
+        """Background writer: wait for a burst to settle, write the newest payload."""
+        while True:
+            time.sleep(self.coalesce_interval)
+            with self._pending_cond:
+                job, self._pending = self._pending, None
+                if job is None:
+                    self._writer = None
+                    self._pending_cond.notify_all()
+                    return
+            try:
+                self.save_json_with_lock(*job)
+            except Exception as e:
+                self._writer_error = e
 
     def load_json_with_lock(self) -> Dict[str, Any]:
         """
@@ -283,12 +517,7 @@ class SafeFileManager:
         Returns:
             Path to backup file
         """
-        if index == 0:
-            return self.filename.with_suffix(self.filename.suffix + '.backup')
-        else:
-            return self.filename.with_suffix(
-                self.filename.suffix + f'.backup.{index}'
-            )
+        return self._backup_paths[index]
 
     def _rotate_backups(self):
         """
@@ -300,21 +529,23 @@ class SafeFileManager:
         3. Rename backup → backup.1
         4. Current file will be copied to backup (by caller)
 
-        This maintains a rolling window of backups.
+        This maintains a rolling window of backups. Missing slots are
+        handled EAFP-style (one syscall per slot, no exists() pre-check).
         """
         # Delete oldest backup if it exists
-        oldest = self._get_backup_path(self.backup_count - 1)
-        if oldest.exists():
-            oldest.unlink()
+        try:
+            os.unlink(self._backup_strs[self.backup_count - 1])
+        except FileNotFoundError:
+            pass
 
         # Rotate existing backups (from newest to oldest)
         # This ensures we don't overwrite files
+        backups = self._backup_strs
         for i in range(self.backup_count - 2, -1, -1):
-            old_path = self._get_backup_path(i)
-            new_path = self._get_backup_path(i + 1)
-
-            if old_path.exists():
-                old_path.rename(new_path)
+            try:
+                os.rename(backups[i], backups[i + 1])
+            except FileNotFoundError:
+                pass
 
     def get_backup_info(self) -> Dict[str, Any]:
         """
@@ -327,15 +558,18 @@ class SafeFileManager:
         """
         backups = []
         for i in range(self.backup_count):
-            backup_path = self._get_backup_path(i)
-            if backup_path.exists():
-                stat = backup_path.stat()
-                backups.append({
-                    'path': str(backup_path),
-                    'size': stat.st_size,
-                    'modified': stat.st_mtime,
-                    'index': i
-                })
+            backup_path = self._backup_strs[i]
+            # One stat per slot; a missing backup raises instead of needing exists()
+            try:
+                stat = os.stat(backup_path)
+            except FileNotFoundError:
+                continue
+            backups.append({
+                'path': backup_path,
+                'size': stat.st_size,
+                'modified': stat.st_mtime,
+                'index': i
+            })
 
         return {
             'count': len(backups),
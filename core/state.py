@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict
-from dataclasses import asdict
+from typing import Optional, List, Dict, Iterable, Deque, BinaryIO
+from collections import deque
+from datetime import datetime
 from pathlib import Path
+from operator import attrgetter
 import json
 
 from typing import Any
@@ -15,6 +17,8 @@ from core.file_safety import (
     SafeFileManager,
     FileLockTimeoutError,
     FileCorruptionError,
+    read_json_stream,
+    write_json_stream,
 )
 from config import ui, performance, USE_UNICODE, DEFAULT_SETTINGS_FILE
 
@@ -22,6 +26,13 @@ from config import ui, performance, USE_UNICODE, DEFAULT_SETTINGS_FILE
 # AI Conversation limits
 MAX_CONVERSATION_MESSAGES = 100
 
+# Sort keys resolved once; attrgetter is implemented in C
+_SORT_KEYS = {
+    "priority": attrgetter("priority"),
+    "id": attrgetter("id"),
+    "name": lambda t: (t.name or "").casefold(),
+}
+
 
 class AppState:
     def __init__(self):
@@ -51,22 +62,34 @@ class AppState:
         self.ai_streaming: bool = False
 
         # Conversation state and file manager
-        self.ai_conversation: List[AIMessage] = []
+        # Bounded: appends past the limit drop the oldest message in O(1)
+        self.ai_conversation: Deque[AIMessage] = deque(maxlen=MAX_CONVERSATION_MESSAGES)
         self._ai_file_manager: Optional[SafeFileManager] = None
 
         # Indices
         self._task_index: Optional[Dict[int, Task]] = (
             {} if performance.USE_TASK_INDEX else None
         )
-        self._tag_index: Dict[str, List[Task]] = {}
+        # tag -> {task id: task}; dict buckets keep insertion order and make
+        # removal O(1) (Task is an unhashable dataclass, so no set[Task])
+        self._tag_index: Dict[str, Dict[int, Task]] = {}
+        # tag -> number of done tasks in that bucket, kept current by the
+        # index helpers and set_done() so tag stats don't rescan tasks.
+        # Assigning Task.done directly bypasses it and leaves stats stale.
+        self._tag_done_counts: Dict[str, int] = {}
 
         # File manager for tasks
         self._file_manager: Optional[SafeFileManager] = None
 
-        # Filter cache
+        # Filter cache, keyed by (filter, tasks version); every task mutation
+        # goes through invalidate_filter_cache(), which bumps the version
+        self._tasks_version: int = 0
         self._filtered_tasks_cache: Optional[List[Task]] = None
-        self._filter_cache_dirty: bool = True
-        self._current_filter: str = "none"
+        self._filter_cache_key: Optional[tuple[str, int]] = None
+        self._filter_plan: Optional[tuple[str, Any]] = None
+        # Sorted view of filtered_tasks for paging, same invalidation
+        self._view_cache: Optional[List[Task]] = None
+        self._view_cache_key: Optional[tuple] = None
 
         # Data integrity tracking
         self._last_saved_count: int = 0
@@ -76,14 +99,19 @@ class AppState:
     # ------------------------------------------------------------------
     def add_task(self, name: str, comment: str, description: str, priority: int, tag: str):
         tag_list = parse_tags(tag, warn_callback=lambda msg: print(f"Warning: {msg}"))
-        task = Task(
+        # parse_tags output is already normalized, so skip Task.__post_init__;
+        # the slice keeps Task's 3-tag cap even if the config limit is raised
+        now = datetime.now().isoformat()
+        task = Task.from_raw(
             id=self.next_id,
             name=(name or "").strip(),
             comment=(comment or "").strip(),
             description=(description or "").strip(),
             priority=priority,
             tag=tag_list[0] if tag_list else "",
-            tags=tag_list,
+            tags=tag_list[:3],
+            created_at=now,
+            updated_at=now,
         )
         self.tasks.append(task)
 
@@ -91,25 +119,52 @@ class AppState:
             self._task_index[task.id] = task
 
         for t in task.tags:
-            self._tag_index.setdefault(t, []).append(task)
+            self._tag_index.setdefault(t, {})[task.id] = task
 
         self.next_id += 1
         self.invalidate_filter_cache()
 
+    def bulk_add_tasks(self, tasks_kwargs: Iterable[Dict[str, Any]]) -> List[Task]:
+        """
+        Add many tasks in one pass, rebuilding the indexes once.
+
+        Each item holds Task fields except ``id`` (assigned from next_id).
+        Tags go through Task normalization, not parse_tags warnings.
+        """
+        start = self.next_id
+        new_tasks = [Task(id=start + i, **kwargs) for i, kwargs in enumerate(tasks_kwargs)]
+        self.tasks.extend(new_tasks)
+        self.next_id = start + len(new_tasks)
+        self._rebuild_index()
+        self._rebuild_tag_index()
+        self.invalidate_filter_cache()
+        return new_tasks
+
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         if self._task_index is not None:
             return self._task_index.get(task_id)
         return next((t for t in self.tasks if t.id == task_id), None)
 
+    def set_done(self, task: Task, done: bool) -> None:
+        """
+        Set task.done, keeping per-tag done counts and filters in sync.
+
+        Every done/undone change must go through here; assigning task.done
+        directly leaves get_all_tags_with_stats() reporting stale counts.
+        """
+        done = bool(done)
+        if task.done != done:
+            for t in task.tags:
+                if task.id in self._tag_index.get(t, ()):
+                    self._bump_done_count(t, 1 if done else -1)
+            task.done = done
+        self.invalidate_filter_cache()
+
     def remove_task(self, task: Task):
         self.tasks.remove(task)
         if self._task_index is not None and task.id in self._task_index:
             del self._task_index[task.id]
-        for t in list(task.tags):
-            if t in self._tag_index and task in self._tag_index[t]:
-                self._tag_index[t].remove(task)
-                if not self._tag_index[t]:
-                    del self._tag_index[t]
+        self._discard_from_tag_index(task, task.tags)
         self.invalidate_filter_cache()
 
     def _rebuild_index(self) -> None:
@@ -118,28 +173,53 @@ class AppState:
 
     def _rebuild_tag_index(self) -> None:
         self._tag_index = {}
+        self._tag_done_counts = {}
         for task in self.tasks:
             for t in task.tags:
-                self._tag_index.setdefault(t, []).append(task)
+                self._tag_index.setdefault(t, {})[task.id] = task
+                if task.done:
+                    self._bump_done_count(t, 1)
+
+    def _bump_done_count(self, tag: str, delta: int) -> None:
+        count = self._tag_done_counts.get(tag, 0) + delta
+        if count > 0:
+            self._tag_done_counts[tag] = count
+        else:
+            self._tag_done_counts.pop(tag, None)
+
+    def _discard_from_tag_index(self, task: Task, tags: Iterable[str]) -> None:
+        for t in tags:
+            bucket = self._tag_index.get(t)
+            if bucket is None or bucket.pop(task.id, None) is None:
+                continue
+            if task.done:
+                self._bump_done_count(t, -1)
+            if not bucket:
+                del self._tag_index[t]
 
     def _update_tag_index_for_task(self, task: Task, old_tags: Optional[List[str]] = None) -> None:
-        if old_tags:
-            for t in old_tags:
-                if t in self._tag_index and task in self._tag_index[t]:
-                    self._tag_index[t].remove(task)
-                    if not self._tag_index[t]:
-                        del self._tag_index[t]
+        # Only touch buckets whose membership changed, so unchanged tags keep
+        # the task at its existing position
+        old_set = set(old_tags) if old_tags else set()
+        self._discard_from_tag_index(task, old_set.difference(task.tags))
         for t in task.tags:
-            if task not in self._tag_index.setdefault(t, []):
-                self._tag_index[t].append(task)
+            if t in old_set:
+                continue
+            bucket = self._tag_index.setdefault(t, {})
+            if task.id not in bucket:
+                bucket[task.id] = task
+                if task.done:
+                    self._bump_done_count(t, 1)
 
     def get_tasks_by_tag(self, tag: str) -> List[Task]:
-        return self._tag_index.get(normalize_tag(tag), [])
+        return list(self._tag_index.get(normalize_tag(tag), {}).values())
 
     def get_all_tags_with_stats(self) -> Dict[str, Dict[str, int]]:
+        # O(tags): bucket sizes give totals, _tag_done_counts the done part
+        done_counts = self._tag_done_counts
         stats: Dict[str, Dict[str, int]] = {}
         for t, tasks in self._tag_index.items():
-            done = sum(1 for x in tasks if x.done)
+            done = done_counts.get(t, 0)
             total = len(tasks)
             stats[t] = {"done": done, "total": total, "pending": total - done}
         return stats
@@ -148,44 +228,95 @@ class AppState:
     # Filtering / Sorting / Paging
     # ------------------------------------------------------------------
     def get_filter_tasks(self, tasks: List[Task]) -> List[Task]:
-        from utils.filter_parser import parse_filter_expression, matches_all_conditions
-
         filter_value = (self.filter or "").strip()
         if not filter_value or filter_value.lower() == "none":
             return tasks
 
-        conditions = parse_filter_expression(filter_value)
-        if not conditions:
+        plan = self._compile_filter(filter_value)
+        if plan is None:
             return tasks
-        return [t for t in tasks if matches_all_conditions(t, conditions)]
+        tag_value, rest_match, match = plan
+        if tasks is self.tasks and tag_value is not None:
+            # A "tag=..." condition narrows the candidates through the tag
+            # index; the id() pass keeps list order, and any remaining
+            # conditions are only evaluated on those candidates
+            members = self._tag_index_members(tag_value)
+            if not members:
+                return []
+            tasks = [t for t in tasks if id(t) in members]
+            if rest_match is None:
+                return tasks
+            return [t for t in tasks if rest_match(t)]
+        return [t for t in tasks if match(t)]
+
+    def _compile_filter(self, filter_value: str):
+        """
+        (tag value, predicate without it, full predicate) for a filter string.
+
+        Compiled predicates only depend on the filter text, so the plan for
+        the current filter is kept until the filter string changes.
+        """
+        cached = self._filter_plan
+        if cached is not None and cached[0] == filter_value:
+            return cached[1]
+
+        from utils.filter_parser import parse_filter_expression, compile_filter
+
+        conditions = parse_filter_expression(filter_value)
+        plan = None
+        if conditions:
+            tag_cond = next(
+                (c for c in conditions if c.field == "tag" and c.operator == "="), None
+            )
+            match = compile_filter(conditions)
+            if tag_cond is None:
+                plan = (None, None, match)
+            else:
+                rest = [c for c in conditions if c is not tag_cond]
+                plan = (tag_cond.value, compile_filter(rest) if rest else None, match)
+        self._filter_plan = (filter_value, plan)
+        return plan
+
+    def _tag_index_members(self, value: str) -> set:
+        """id()s of tasks matching a tag filter value: a+b (all), a,b (any) or a."""
+        if "+" in value:
+            buckets = [self._tag_index.get(t.strip()) for t in value.split("+")]
+            if not all(buckets):
+                return set()
+            buckets.sort(key=len)
+            members = {id(t) for t in buckets[0].values()}
+            for bucket in buckets[1:]:
+                members.intersection_update(map(id, bucket.values()))
+            return members
+        members = set()
+        for tag in value.split(","):
+            members.update(map(id, self._tag_index.get(tag.strip(), {}).values()))
+        return members
 
     @property
     def filtered_tasks(self) -> List[Task]:
-        filter_changed = self._current_filter != self.filter
-        if filter_changed:
-            self._current_filter = self.filter
-            self._filter_cache_dirty = True
-
-        if not self._filter_cache_dirty and self._filtered_tasks_cache is not None:
+        key = (self.filter, self._tasks_version)
+        if key == self._filter_cache_key and self._filtered_tasks_cache is not None:
             return self._filtered_tasks_cache
 
         filtered = self.get_filter_tasks(self.tasks)
         self._filtered_tasks_cache = filtered
-        self._filter_cache_dirty = False
+        self._filter_cache_key = key
         return filtered
 
+    @property
+    def _filter_cache_dirty(self) -> bool:
+        return self._filter_cache_key != (self.filter, self._tasks_version)
+
     def invalidate_filter_cache(self) -> None:
-        self._filter_cache_dirty = True
+        self._tasks_version += 1
 
     def get_sorted_tasks(self, tasks: List[Task]) -> List[Task]:
         reverse = (self.sort_order == "desc")
 
-        if self.sort == "priority":
-            return sorted(tasks, key=lambda t: t.priority, reverse=reverse)
-        if self.sort == "id":
-            return sorted(tasks, key=lambda t: t.id, reverse=reverse)
-        if self.sort == "name":
-            return sorted(tasks, key=lambda t: (t.name or "").casefold(), reverse=reverse)
+        key = _SORT_KEYS.get(self.sort)
+        if key is not None:
+            return sorted(tasks, key=key, reverse=reverse)
         if self.sort == "age":
             from utils.time import age_seconds
 
@@ -201,11 +332,16 @@ class AppState:
     def get_current_page_tasks(self) -> List[Task]:
         # Page size from config based on view mode
         self.page_size = ui.COMPACT_PAGE_SIZE if self.view_mode == "compact" else ui.DETAIL_PAGE_SIZE
-        show_tasks = self.filtered_tasks
-        show_tasks = self.get_sorted_tasks(show_tasks)
         start = self.page * self.page_size
-        end = start + self.page_size
-        return show_tasks[start:end]
+        return self._get_view()[start:start + self.page_size]
+
+    def _get_view(self) -> List[Task]:
+        """Filtered + sorted tasks, re-sorted only when filter, sort or tasks change."""
+        key = (self.filter, self.sort, self.sort_order, self._tasks_version)
+        if key != self._view_cache_key or self._view_cache is None:
+            self._view_cache = self.get_sorted_tasks(self.filtered_tasks)
+            self._view_cache_key = key
+        return self._view_cache
 
     # ------------------------------------------------------------------
     # Persistence (tasks)
@@ -277,7 +413,8 @@ class AppState:
                     f"[yellow]{warning_mark} Warning: Task count dropped from {self._last_saved_count} to {current_count}[/yellow]",
                 )
 
-            tasks_data = [asdict(task) for task in self.tasks]
+            # Task dataclasses are encoded directly (no asdict() per task)
+            tasks_data = list(self.tasks)
             self._file_manager.save_json_with_lock(tasks_data, indent=performance.JSON_INDENT)
 
             debug_log.info(f"[STATE] Save successful - {len(self.tasks)} tasks written")
@@ -447,16 +584,13 @@ class AppState:
     def add_ai_message(self, role: str, content: str) -> AIMessage:
         message = AIMessage(role=role, content=content)
         self.ai_conversation.append(message)
-        if len(self.ai_conversation) > MAX_CONVERSATION_MESSAGES:
-            over = len(self.ai_conversation) - MAX_CONVERSATION_MESSAGES
-            self.ai_conversation = self.ai_conversation[over:]
         return message
 
     def clear_conversation(self) -> None:
-        self.ai_conversation = []
+        self.ai_conversation.clear()
 
     def get_conversation_context(self, max_messages: int = 20) -> List[dict]:
-        recent = self.ai_conversation[-max_messages:]
+        recent = list(self.ai_conversation)[-max_messages:]
         return [m.get_openai_format() for m in recent]
 
     def get_total_tokens(self) -> int:
@@ -468,7 +602,8 @@ class AppState:
                 filename, lock_timeout=5.0, backup_count=3, console=console
             )
         try:
-            data = [m.to_dict() for m in self.ai_conversation]
+            # AIMessage dataclasses are encoded directly (same keys as to_dict())
+            data = list(self.ai_conversation)
             self._ai_file_manager.save_json_with_lock(data, indent=2)
             check_mark = "✓" if USE_UNICODE else "+"
             console.print(f"[green]{check_mark}[/green] Conversation saved to [bold]{filename}[/bold]")
@@ -486,7 +621,8 @@ class AppState:
             )
         try:
             data = self._ai_file_manager.load_json_with_lock()
-            self.ai_conversation = [AIMessage.from_dict(m) for m in data]
+            self.ai_conversation.clear()
+            self.ai_conversation.extend(AIMessage.from_dict(m) for m in data)
             check_mark = "✓" if USE_UNICODE else "+"
             console.print(
                 f"[green]{check_mark}[/green] Conversation loaded from [bold]{filename}[/bold] ({len(self.ai_conversation)} messages)"
@@ -494,22 +630,25 @@ class AppState:
         except FileNotFoundError:
             info_mark = "ℹ" if USE_UNICODE else "i"
             console.print(f"[yellow]{info_mark}[/yellow] No saved conversation found. Starting fresh.")
-            self.ai_conversation = []
+            self.ai_conversation.clear()
         except FileCorruptionError:
             x_mark = "✗" if USE_UNICODE else "X"
             console.print(f"[red]{x_mark}[/red] Conversation file corrupted. Starting fresh.")
-            self.ai_conversation = []
+            self.ai_conversation.clear()
         except Exception as e:
             x_mark = "✗" if USE_UNICODE else "X"
             console.print(f"[red]{x_mark}[/red] Error loading conversation: {e}. Starting fresh.")
-            self.ai_conversation = []
+            self.ai_conversation.clear()
 
 # --- Runtime overrides for output glyphs and save/load to avoid mojibake ---
 # Some environments produced corrupted glyphs in string literals. The following
 # overrides replace any problematic implementations with clean, safe versions.
 
-def _appstate_save_to_file_clean(self, filename: str, console: Console | None):
-    if self._file_manager is None:
+def _appstate_save_to_file_clean(self, filename: str | BinaryIO, console: Console | None):
+    # A writable binary stream (e.g. io.BytesIO) gets the JSON directly;
+    # paths go through SafeFileManager for atomic writes and backups
+    to_stream = hasattr(filename, "write")
+    if not to_stream and self._file_manager is None:
         self._file_manager = SafeFileManager(
             filename, lock_timeout=5.0, backup_count=3, console=console
         )
@@ -538,14 +677,18 @@ def _appstate_save_to_file_clean(self, filename: str, console: Console | None):
                     f"[red]{warn} CRITICAL: Attempting to delete ALL {self._last_saved_count} tasks! Check backup files.[/red]"
                 )
             return
-        tasks_data = [asdict(task) for task in self.tasks]
-        self._file_manager.save_json_with_lock(tasks_data, indent=performance.JSON_INDENT)
+        tasks_data = list(self.tasks)
+        if to_stream:
+            write_json_stream(filename, tasks_data, indent=performance.JSON_INDENT)
+        else:
+            self._file_manager.save_json_with_lock(tasks_data, indent=performance.JSON_INDENT)
         _dl.info(f"[STATE] Save successful - {len(self.tasks)} tasks written")
         check = "✓" if USE_UNICODE else "+"
         if console:
             console.print(f"[green]{check}[/green] Tasks saved to [bold]{filename}[/bold]")
         self._last_saved_count = current_count
-        self._save_preferences()
+        if not to_stream:
+            self._save_preferences()
     except FileLockTimeoutError as e:
         x = "✗" if USE_UNICODE else "X"
         bulb = "💡" if USE_UNICODE else "!"
@@ -558,18 +701,23 @@ def _appstate_save_to_file_clean(self, filename: str, console: Console | None):
             console.print(f"[red]{x}[/red] Failed to save tasks: {e}")
 
 
-def _appstate_load_from_file_clean(self, filename: str, console: Console):
-    if self._file_manager is None:
+def _appstate_load_from_file_clean(self, filename: str | BinaryIO, console: Console):
+    from_stream = hasattr(filename, "read")
+    if not from_stream and self._file_manager is None:
         self._file_manager = SafeFileManager(
             filename, lock_timeout=5.0, backup_count=3, console=console
         )
     try:
-        tasks_data = self._file_manager.load_json_with_lock()
+        if from_stream:
+            tasks_data = read_json_stream(filename)
+        else:
+            tasks_data = self._file_manager.load_json_with_lock()
         self.tasks = [Task(**t) for t in tasks_data]
         self.next_id = max((t.id for t in self.tasks), default=0) + 1
         self._rebuild_index()
         self._rebuild_tag_index()
-        self._load_preferences()
+        if not from_stream:
+            self._load_preferences()
         check = "✓" if USE_UNICODE else "+"
         console.print(f"[green]{check}[/green] Tasks loaded from [bold]{filename}[/bold]")
         try:
@@ -596,6 +744,8 @@ def _appstate_load_from_file_clean(self, filename: str, console: Console):
         console.print(f"[red]{x}[/red] Error loading tasks: {e}")
         self.tasks = []
         self.next_id = 1
+    # Every branch above replaces self.tasks
+    self.invalidate_filter_cache()
 
 
 def _appstate_save_conversation_clean(self, filename: str, console: Console) -> None:
@@ -604,7 +754,8 @@ def _appstate_save_conversation_clean(self, filename: str, console: Console) ->
             filename, lock_timeout=5.0, backup_count=3, console=console
         )
     try:
-        data = [m.to_dict() for m in self.ai_conversation]
+        # AIMessage dataclasses are encoded directly (same keys as to_dict())
+        data = list(self.ai_conversation)
         self._ai_file_manager.save_json_with_lock(data, indent=2)
         check = "✓" if USE_UNICODE else "+"
         console.print(f"[green]{check}[/green] Conversation saved to [bold]{filename}[/bold]")
@@ -623,7 +774,8 @@ def _appstate_load_conversation_clean(self, filename: str, console: Console) ->
         )
     try:
         data = self._ai_file_manager.load_json_with_lock()
-        self.ai_conversation = [AIMessage.from_dict(m) for m in data]
+        self.ai_conversation.clear()
+        self.ai_conversation.extend(AIMessage.from_dict(m) for m in data)
         check = "✓" if USE_UNICODE else "+"
         console.print(
             f"[green]{check}[/green] Conversation loaded from [bold]{filename}[/bold] ({len(self.ai_conversation)} messages)"
@@ -631,15 +783,15 @@ def _appstate_load_conversation_clean(self, filename: str, console: Console) ->
     except FileNotFoundError:
         info = "ℹ" if USE_UNICODE else "i"
         console.print(f"[yellow]{info}[/yellow] No saved conversation found. Starting fresh.")
-        self.ai_conversation = []
+        self.ai_conversation.clear()
     except FileCorruptionError:
         x = "✗" if USE_UNICODE else "X"
         console.print(f"[red]{x}[/red] Conversation file corrupted. Starting fresh.")
-        self.ai_conversation = []
+        self.ai_conversation.clear()
     except Exception as e:
         x = "✗" if USE_UNICODE else "X"
         console.print(f"[red]{x}[/red] Error loading conversation: {e}. Starting fresh.")
-        self.ai_conversation = []
+        self.ai_conversation.clear()
 
 
 # Apply overrides (last definition wins)
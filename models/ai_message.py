@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class AIMessage:
     """
     A message in the AI conversation
@@ -3,7 +3,7 @@ from typing import List
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: int
     name: str
@@ -43,6 +43,19 @@ class Task:
             if not self.updated_at:
                 self.updated_at = self.created_at
 
+    @classmethod
+    def from_raw(cls, **fields) -> "Task":
+        """
+        Build a Task from already-normalized field values, skipping __init__/__post_init__
+
+        Callers must pass lowercase tags (max 3), a synced legacy tag and timestamps;
+        intended for bulk/factory construction where values are known-valid.
+        """
+        task = cls.__new__(cls)
+        for name, value in {**_RAW_DEFAULTS, "tags": [], **fields}.items():
+            setattr(task, name, value)
+        return task
+
     def get_tags_display(self) -> str:
         """Get comma-separated tags for display"""
         return ", ".join(self.tags) if self.tags else ""
@@ -64,3 +77,12 @@ class Task:
             self.tag = self.tags[0] if self.tags else ""  # Keep legacy field synced
             return True
         return False
+
+
+# Defaults applied by Task.from_raw (tags handled separately: mutable)
+_RAW_DEFAULTS = {
+    "done": False,
+    "created_at": "",
+    "completed_at": "",
+    "updated_at": "",
+}
@@ -3,7 +3,10 @@ Shared pytest fixtures and configuration for all tests
 """
 
 import pytest
+import json
 import tempfile
+import time
+from collections import defaultdict
 from pathlib import Path
 from io import StringIO
 
@@ -11,6 +14,11 @@ from core.state import AppState
 from models.task import Task
 
 
+# Fixed timestamp for fixture-built tasks: avoids a datetime.now() call per
+# Task and keeps fixture data deterministic.
+FIXED_TIMESTAMP = "2024-01-01T00:00:00"
+
+
 @pytest.fixture
 def app_state():
     """
@@ -22,6 +30,20 @@ def app_state():
     return AppState()
 
 
+@pytest.fixture(scope="session")
+def parse_state():
+    """
+    Shared AppState for tests that only call parse_command
+
+    parse_command touches nothing but state.messages (which it resets on
+    every call), so one instance can serve every parse-only test.
+
+    Returns:
+        AppState: A session-wide AppState instance
+    """
+    return AppState()
+
+
 @pytest.fixture
 def populated_state():
     """
@@ -40,8 +62,8 @@ def populated_state():
     state.add_task("Update docs", "", "Update README", 2, "work")
 
     # Mark some as done
-    state.get_task_by_id(2).done = True
-    state.get_task_by_id(5).done = True
+    state.set_done(state.get_task_by_id(2), True)
+    state.set_done(state.get_task_by_id(5), True)
 
     return state
 
@@ -63,6 +85,8 @@ def sample_task():
         tag="work",
         tags=["work", "testing"],
         done=False,
+        created_at=FIXED_TIMESTAMP,
+        updated_at=FIXED_TIMESTAMP,
     )
 
 
@@ -94,6 +118,45 @@ def temp_json_file(tmp_path):
     return tmp_path / "test_tasks.json"
 
 
+@pytest.fixture
+def make_task():
+    """
+    Factory for Task objects with test defaults
+
+    Timestamps default to FIXED_TIMESTAMP, so building a task doesn't call
+    datetime.now(); pass any Task field as a keyword to override it.
+
+    Returns:
+        Callable[..., Task]: Task builder
+    """
+    def _make(**overrides):
+        fields = dict(
+            id=1, name="Task", comment="", description="", priority=2, tag="",
+            created_at=FIXED_TIMESTAMP, updated_at=FIXED_TIMESTAMP,
+        )
+        fields.update(overrides)
+        return Task(**fields)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_tasks_json():
+    """
+    Two-task tasks file, encoded once for every load test that needs it
+
+    Returns:
+        bytes: JSON-encoded list of task dictionaries
+    """
+    return json.dumps([
+        create_task_dict(
+            id=1, name="Task 1", comment="Comment", description="Desc",
+            priority=1, tag="work", tags=["work"],
+        ),
+        create_task_dict(id=2, name="Task 2"),
+    ]).encode()
+
+
 class Console:
     """Minimal console stub with print() compatible API used by AppState."""
 
@@ -115,9 +178,12 @@ class NullConsole(Console):
         super().__init__(file=StringIO(), force_terminal=False, width=120)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def console():
-    """Default console for tests (captured output)."""
+    """Default console for tests (captured output, shared across the session).
+
+    The capture buffer is cleared after each test by ``reset_test_environment``.
+    """
     return Console(file=StringIO(), force_terminal=False, width=100)
 
 
@@ -126,6 +192,28 @@ def null_console():
     """High-performance console discarding output (for performance tests)."""
     return NullConsole()
 
+# Per-fixture setup timing (reported alongside ``pytest --durations=N``)
+FIXTURE_BUDGET_MS = 50.0
+_fixture_setup_ms = defaultdict(float)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    start = time.perf_counter()
+    yield
+    _fixture_setup_ms[fixturedef.argname] += (time.perf_counter() - start) * 1000
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not config.getoption("durations", None) or not _fixture_setup_ms:
+        return
+    terminalreporter.section("fixture setup times")
+    ranked = sorted(_fixture_setup_ms.items(), key=lambda kv: kv[1], reverse=True)
+    for name, total_ms in ranked[:20]:
+        flag = "  (over budget)" if total_ms > FIXTURE_BUDGET_MS else ""
+        terminalreporter.write_line(f"{total_ms:10.2f}ms  {name}{flag}")
+
+
 # Custom assertion helpers
 def assert_task_equals(actual, expected):
     assert actual.id == expected.id
@@ -155,32 +243,60 @@ def tasks_list():
     Returns:
         list[Task]: List of 10 sample tasks with various attributes
     """
+    ts = FIXED_TIMESTAMP
     tasks = [
-        Task(id=1, name="High priority work", comment="", description="", priority=1, tag="work", tags=["work"], done=False),
-        Task(id=2, name="Medium priority work", comment="", description="", priority=2, tag="work", tags=["work"], done=False),
-        Task(id=3, name="Low priority work", comment="", description="", priority=3, tag="work", tags=["work"], done=True),
-        Task(id=4, name="High priority personal", comment="", description="", priority=1, tag="personal", tags=["personal"], done=False),
-        Task(id=5, name="Medium priority personal", comment="", description="", priority=2, tag="personal", tags=["personal"], done=True),
-        Task(id=6, name="Urgent work task", comment="", description="", priority=1, tag="work", tags=["work", "urgent"], done=False),
-        Task(id=7, name="Project task", comment="", description="", priority=2, tag="project", tags=["project", "work"], done=False),
-        Task(id=8, name="Quick fix", comment="", description="", priority=1, tag="work", tags=["work"], done=True),
-        Task(id=9, name="Long term goal", comment="", description="", priority=3, tag="personal", tags=["personal"], done=False),
-        Task(id=10, name="Shopping", comment="", description="", priority=3, tag="personal", tags=["personal", "shopping"], done=False),
+        Task(id=1, name="High priority work", comment="", description="", priority=1, tag="work", tags=["work"], done=False, created_at=ts, updated_at=ts),
+        Task(id=2, name="Medium priority work", comment="", description="", priority=2, tag="work", tags=["work"], done=False, created_at=ts, updated_at=ts),
+        Task(id=3, name="Low priority work", comment="", description="", priority=3, tag="work", tags=["work"], done=True, created_at=ts, updated_at=ts),
+        Task(id=4, name="High priority personal", comment="", description="", priority=1, tag="personal", tags=["personal"], done=False, created_at=ts, updated_at=ts),
+        Task(id=5, name="Medium priority personal", comment="", description="", priority=2, tag="personal", tags=["personal"], done=True, created_at=ts, updated_at=ts),
+        Task(id=6, name="Urgent work task", comment="", description="", priority=1, tag="work", tags=["work", "urgent"], done=False, created_at=ts, updated_at=ts),
+        Task(id=7, name="Project task", comment="", description="", priority=2, tag="project", tags=["project", "work"], done=False, created_at=ts, updated_at=ts),
+        Task(id=8, name="Quick fix", comment="", description="", priority=1, tag="work", tags=["work"], done=True, created_at=ts, updated_at=ts),
+        Task(id=9, name="Long term goal", comment="", description="", priority=3, tag="personal", tags=["personal"], done=False, created_at=ts, updated_at=ts),
+        Task(id=10, name="Shopping", comment="", description="", priority=3, tag="personal", tags=["personal", "shopping"], done=False, created_at=ts, updated_at=ts),
     ]
     return tasks
 
 
+# Fixtures that provide the AppState bound into core.ai_tools (first match wins)
+AI_TOOLS_STATE_FIXTURES = ("snapshot_state", "setup_state", "app_state")
+
+
+@pytest.fixture(autouse=True)
+def bind_ai_tools_state(request):
+    """
+    Bind the test's AppState into core.ai_tools and clear it afterwards
+
+    Only applies to test modules that import ``ai_tools``, so the rest of the
+    suite never touches (or imports) the AI tool module.
+    """
+    tools = getattr(request.module, "ai_tools", None)
+    if tools is None:
+        yield
+        return
+    name = next((n for n in AI_TOOLS_STATE_FIXTURES if n in request.fixturenames), None)
+    if name is not None:
+        tools.set_app_state(request.getfixturevalue(name))
+    yield
+    tools.set_app_state(None)
+
+
 @pytest.fixture(autouse=True)
-def reset_test_environment():
+def reset_test_environment(request):
     """
     Automatically run before each test to ensure clean environment
 
     This fixture runs automatically for all tests (autouse=True)
     """
     # Setup: runs before each test
+    shared_console = request.getfixturevalue("console") if "console" in request.fixturenames else None
     yield
     # Teardown: runs after each test
-    # Add any cleanup code here if needed
+    if shared_console is not None:
+        # Session-scoped console: drop this test's captured output
+        shared_console.file.seek(0)
+        shared_console.file.truncate()
 
 
 # Helper functions for tests
@@ -211,7 +327,7 @@ def create_task_dict(id=1, name="Test", comment="", description="", priority=2,
         "tag": tag,
         "tags": tags or [],
         "done": done,
-        "created_at": "2024-01-01T00:00:00",
+        "created_at": FIXED_TIMESTAMP,
         "completed_at": "",
-        "updated_at": "2024-01-01T00:00:00",
+        "updated_at": FIXED_TIMESTAMP,
     }
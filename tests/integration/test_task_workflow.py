@@ -69,8 +69,9 @@ class TestTaskLifecycle:
     def test_create_multiple_tasks_workflow(self, app_state, console):
         """Test creating multiple tasks and verifying state"""
         # Create 5 tasks
-        for i in range(1, 6):
-            handle_command(f'add "Task {i}" "Comment {i}" "" {(i % 3) + 1} "tag{i % 3}"', app_state, console)
+        cmds = [f'add "Task {i}" "Comment {i}" "" {(i % 3) + 1} "tag{i % 3}"' for i in range(1, 6)]
+        for cmd in cmds:
+            handle_command(cmd, app_state, console)
 
         assert len(app_state.tasks) == 5
 
@@ -87,8 +88,9 @@ class TestTaskLifecycle:
         monkeypatch.setattr(core.commands, 'confirm', lambda msg, **kwargs: True)
 
         # Create 10 tasks
-        for i in range(1, 11):
-            handle_command(f'add "Task {i}"', app_state, console)
+        cmds = [f'add "Task {i}"' for i in range(1, 11)]
+        for cmd in cmds:
+            handle_command(cmd, app_state, console)
 
         assert len(app_state.tasks) == 10
 
@@ -117,8 +119,9 @@ class TestFilterWorkflow:
     def test_filter_by_status_workflow(self, app_state, console):
         """Test filtering by task status"""
         # Create tasks with mixed statuses
-        for i in range(1, 11):
-            handle_command(f'add "Task {i}"', app_state, console)
+        cmds = [f'add "Task {i}"' for i in range(1, 11)]
+        for cmd in cmds:
+            handle_command(cmd, app_state, console)
 
         # Mark some as done
         handle_command('done 1 3 5 7 9', app_state, console)
@@ -140,8 +143,9 @@ class TestFilterWorkflow:
     def test_filter_by_priority_workflow(self, app_state, console):
         """Test filtering by priority"""
         # Create tasks with different priorities
-        for priority in [1, 1, 2, 2, 3, 3]:
-            handle_command(f'add "Task P{priority}" "" "" {priority}', app_state, console)
+        cmds = [f'add "Task P{priority}" "" "" {priority}' for priority in [1, 1, 2, 2, 3, 3]]
+        for cmd in cmds:
+            handle_command(cmd, app_state, console)
 
         # Filter high priority
         app_state.filter = "priority=1"
@@ -205,9 +209,9 @@ class TestSortWorkflow:
     def test_filter_then_sort_workflow(self, app_state, console):
         """Test filtering then sorting"""
         # Create tasks
-        for i in range(1, 6):
-            priority = (i % 3) + 1
-            handle_command(f'add "Task {i}" "" "" {priority} "work"', app_state, console)
+        cmds = [f'add "Task {i}" "" "" {(i % 3) + 1} "work"' for i in range(1, 6)]
+        for cmd in cmds:
+            handle_command(cmd, app_state, console)
 
         # Mark some done
         handle_command('done 1 2', app_state, console)
@@ -234,8 +238,9 @@ class TestPersistenceWorkflow:
     def test_create_save_load_workflow(self, app_state, console, temp_tasks_file):
         """Test creating tasks, saving, and loading"""
         # Create tasks
-        for i in range(1, 6):
-            handle_command(f'add "Task {i}"', app_state, console)
+        cmds = [f'add "Task {i}"' for i in range(1, 6)]
+        for cmd in cmds:
+            handle_command(cmd, app_state, console)
 
         # Save to file
         app_state.save_to_file(str(temp_tasks_file), console)
@@ -282,8 +287,9 @@ class TestIndexConsistency:
     def test_index_after_operations(self, app_state, console):
         """Test that indexes remain consistent after operations"""
         # Add tasks
-        for i in range(1, 6):
-            handle_command(f'add "Task {i}" "" "" {i % 3 + 1} "tag{i % 3}"', app_state, console)
+        cmds = [f'add "Task {i}" "" "" {i % 3 + 1} "tag{i % 3}"' for i in range(1, 6)]
+        for cmd in cmds:
+            handle_command(cmd, app_state, console)
 
         # Verify task index
         for i in range(1, 6):
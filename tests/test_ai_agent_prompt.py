@@ -0,0 +1,19 @@
+import pytest
+
+from core.ai_agent import build_system_prompt
+
+
+@pytest.fixture(scope="module")
+def system_prompt():
+    """Prompt is a static template; build it once for the module."""
+    return build_system_prompt()
+
+
+def test_system_prompt_lists_task_and_note_tools(system_prompt):
+    assert "create_task" in system_prompt
+    assert "create_note" in system_prompt
+    assert "Parameter Extraction Rules" in system_prompt
+
+
+def test_system_prompt_is_stable(system_prompt):
+    assert build_system_prompt() == system_prompt
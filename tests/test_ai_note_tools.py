@@ -1,24 +1,43 @@
 import os
+import shutil
 from pathlib import Path
 
+import pytest
+
 from core.state import AppState
 from core import ai_tools
 
 
-def setup_state(tmp_path, monkeypatch):
+@pytest.fixture(scope="session")
+def notes_root(tmp_path_factory):
+    """Temp root created once per session; per-test fixtures reset its contents."""
+    return tmp_path_factory.mktemp("ai_note_tools")
+
+
+@pytest.fixture
+def setup_state(notes_root, monkeypatch):
     # Temp tasks file
-    tasks_file = tmp_path / "tasks.json"
+    tasks_file = notes_root / "tasks.json"
+    if tasks_file.exists():
+        tasks_file.unlink()
     monkeypatch.setattr("config.DEFAULT_TASKS_FILE", str(tasks_file))
-    # Temp notes dir
-    notes_dir = tmp_path / "notes"
+    # Temp notes dir (emptied per test instead of creating a new tree)
+    notes_dir = notes_root / "notes"
+    if notes_dir.exists():
+        shutil.rmtree(notes_dir)
+    notes_dir.mkdir()
     monkeypatch.setattr("config.DEFAULT_NOTES_DIR", str(notes_dir))
-    state = AppState()
-    ai_tools.set_app_state(state)
-    return state
+    monkeypatch.setattr("core.ai_tools.DEFAULT_NOTES_DIR", str(notes_dir))
+    return AppState()
 
 
-def test_create_and_link_note_tool(tmp_path, monkeypatch):
-    state = setup_state(tmp_path, monkeypatch)
+def _last_note_id(state) -> str:
+    """Id prefix of the newest note (create_note refreshes state.notes; ids are time-ordered)."""
+    return state.notes[-1].id[:8]
+
+
+def test_create_and_link_note_tool(setup_state):
+    state = setup_state
     # Create a task to link
     state.add_task(name="T1", comment="", description="", priority=2, tag="a")
 
@@ -27,17 +46,16 @@ def test_create_and_link_note_tool(tmp_path, monkeypatch):
 
     # Link another task id and then unlink
     state.add_task(name="T2", comment="", description="", priority=2, tag="b")
-    nid = res.split()[3][:8] if res else ""
+    nid = _last_note_id(state)
     lr = ai_tools.link_note(note_id=nid, task_id=2)
     assert "Linked" in lr
     ur = ai_tools.unlink_note(note_id=nid, task_id=1)
     assert "Unlinked" in ur
 
 
-def test_edit_note_tags_add_remove(tmp_path, monkeypatch):
-    state = setup_state(tmp_path, monkeypatch)
-    res = ai_tools.create_note(title="Tags", body_md="", tags="one,two", task_ids="")
-    nid = res.split()[3][:8]
+def test_edit_note_tags_add_remove(setup_state):
+    ai_tools.create_note(title="Tags", body_md="", tags="one,two", task_ids="")
+    nid = _last_note_id(setup_state)
     # Add tag with +three and remove -one
     er = ai_tools.edit_note(note_id=nid, field="tags", value="+three -one")
     assert "Updated note" in er
@@ -46,12 +64,10 @@ def test_edit_note_tags_add_remove(tmp_path, monkeypatch):
     assert "tags:" in dr and "three" in dr and "one" not in dr
 
 
-def test_search_notes_and_delete_guard(tmp_path, monkeypatch):
-    state = setup_state(tmp_path, monkeypatch)
+def test_search_notes_and_delete_guard(setup_state):
     ai_tools.create_note(title="FindMe", body_md="webasto", tags="z", task_ids="")
     s = ai_tools.search_notes(query="webasto")
     assert "FindMe" in s
     # Short prefix delete should be guarded
     dr = ai_tools.delete_note(note_id_prefix="ab", force=False)
     assert "Prefix too short" in dr or "too short" in dr
-
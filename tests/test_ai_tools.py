@@ -1,23 +1,56 @@
+import json
 import os
+import shutil
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
 
 from core.state import AppState
 from core import ai_tools
+from models.task import Task
 
+_TS = "2024-01-01T00:00:00"
 
-def test_edit_task_tag_normalization_updates_tags_and_index(tmp_path, monkeypatch):
-    # Prepare state with a single task
-    state = AppState()
-    state.add_task(name="Test", comment="", description="", priority=2, tag="initial")
 
-    # Point saves to a temp file to avoid polluting repo
+@pytest.fixture(scope="session")
+def snapshot_path(tmp_path_factory):
+    """Serialized single-task workspace, written once per session."""
+    path = tmp_path_factory.mktemp("snapshot") / "tasks.json"
+    task = Task(id=1, name="Test", comment="", description="", priority=2, tag="initial",
+                created_at=_TS, updated_at=_TS)
+    path.write_text(json.dumps([asdict(task)]), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def snapshot_state(snapshot_path, tmp_path, monkeypatch, console):
+    """Fresh AppState loaded from a per-test copy of the snapshot."""
     tasks_file = tmp_path / "tasks.json"
+    shutil.copyfile(snapshot_path, tasks_file)
+    # Point saves to the copy to avoid polluting repo
     monkeypatch.setattr("config.DEFAULT_TASKS_FILE", str(tasks_file))
+    state = AppState()
+    state.load_from_file(str(tasks_file), console)
+    return state
+
 
-    # Initialize tools with state
-    ai_tools.set_app_state(state)
+@pytest.fixture(scope="session")
+def all_ai_tools():
+    """Tool registry built once per session (tests only read it)."""
+    return ai_tools.get_all_tools()
+
+
+def test_tool_registry_contains_task_and_note_tools(all_ai_tools):
+    tool_names = {t.name for t in all_ai_tools}
+    # Lower bound only, so adding tools doesn't break this test
+    assert len(all_ai_tools) >= 20
+    assert {"create_task", "edit_task", "search_tasks", "create_note", "convert_note_to_task"} <= tool_names
+
+
+def test_edit_task_tag_normalization_updates_tags_and_index(snapshot_state):
+    # State with a single task, loaded from snapshot
+    state = snapshot_state
 
     # Edit tags via AI tool
     res = ai_tools.edit_task(task_id=1, field="tag", value="alpha, beta, gamma")
@@ -34,15 +67,13 @@ def test_edit_task_tag_normalization_updates_tags_and_index(tmp_path, monkeypatc
     assert any(t.id == task.id for t in by_tag)
 
 
-def test_create_task_uses_appstate_and_multitags(tmp_path, monkeypatch):
-    state = AppState()
+def test_create_task_uses_appstate_and_multitags(app_state, tmp_path, monkeypatch):
+    state = app_state
 
     # Point saves to a temp file to avoid polluting repo
     tasks_file = tmp_path / "tasks.json"
     monkeypatch.setattr("config.DEFAULT_TASKS_FILE", str(tasks_file))
 
-    ai_tools.set_app_state(state)
-
     # Create task with multiple tags
     res = ai_tools.create_task(
         name="MultiTag",
@@ -5,8 +5,9 @@ Tests all command handlers with edge cases, error conditions, and special scenar
 No mocks where real behavior should be tested - solid, production-ready tests.
 """
 
+import copy
+
 import pytest
-from io import StringIO
 
 from core.commands import (
     parse_command,
@@ -24,107 +25,130 @@ from models.task import Task
 # Use shared `console` fixture from tests/conftest.py
 
 
-@pytest.fixture
-def state_with_tasks(app_state):
-    """AppState with 10 sample tasks for testing"""
-    for i in range(1, 11):
-        app_state.add_task(
+_ALIAS_CASES = (
+    ("a", "add"), ("e", "edit"), ("x", "done"), ("d", "done"),
+    ("u", "undone"), ("n", "next"), ("p", "prev"), ("s", "show"),
+    ("v", "view"), ("f", "filter"), ("t", "tags"), ("h", "help"),
+    ("q", "exit"), ("r", "remove"),
+)
+
+
+@pytest.fixture(scope="module")
+def _master_state_with_tasks():
+    """AppState with 10 sample tasks, built once per module (never mutated)"""
+    state = AppState()
+    # Bulk add: indexes are built once instead of per add_task call
+    state.bulk_add_tasks(
+        dict(
             name=f"Task {i}",
             comment=f"Comment {i}",
             description=f"Description {i}",
             priority=(i % 3) + 1,  # Rotate between 1, 2, 3
-            tag=f"tag{i % 3}"  # Rotate tags
+            tag=f"tag{i % 3}",  # Rotate tags
         )
-    return app_state
+        for i in range(1, 11)
+    )
+    return state
+
+
+@pytest.fixture
+def state_with_tasks(_master_state_with_tasks):
+    """Per-test copy of the 10-task AppState (deepcopy keeps indexes consistent)"""
+    return copy.deepcopy(_master_state_with_tasks)
 
 
 class TestParseCommand:
     """Test command parsing and alias resolution"""
 
-    def test_parse_empty_command(self, app_state, console):
+    def test_parse_empty_command(self, parse_state, console):
         """Test parsing empty command"""
-        result = parse_command("", app_state, console)
+        result = parse_command("", parse_state, console)
         assert result is None
 
-    def test_parse_whitespace_only(self, app_state, console):
+    def test_parse_whitespace_only(self, parse_state, console):
         """Test parsing whitespace-only command"""
-        result = parse_command("   ", app_state, console)
+        result = parse_command("   ", parse_state, console)
         assert result is None
 
-    def test_parse_simple_command(self, app_state, console):
+    def test_parse_simple_command(self, parse_state, console):
         """Test parsing simple command without arguments"""
-        cmd, parts = parse_command("help", app_state, console)
+        cmd, parts = parse_command("help", parse_state, console)
         assert cmd == "help"
         assert parts == ["help"]
 
-    def test_parse_command_with_args(self, app_state, console):
+    def test_parse_command_with_args(self, parse_state, console):
         """Test parsing command with arguments"""
-        cmd, parts = parse_command("add Task1", app_state, console)
+        cmd, parts = parse_command("add Task1", parse_state, console)
         assert cmd == "add"
         assert parts == ["add", "Task1"]
 
-    def test_parse_quoted_arguments(self, app_state, console):
+    def test_parse_quoted_arguments(self, parse_state, console):
         """Test parsing command with quoted arguments"""
-        cmd, parts = parse_command('add "Task with spaces" "comment"', app_state, console)
+        cmd, parts = parse_command('add "Task with spaces" "comment"', parse_state, console)
         assert cmd == "add"
         assert parts == ["add", "Task with spaces", "comment"]
 
-    def test_parse_alias_expansion(self, app_state, console):
+    def test_parse_alias_expansion(self, parse_state, console):
         """Test that aliases are expanded correctly"""
-        cmd, parts = parse_command("a Task", app_state, console)
+        cmd, parts = parse_command("a Task", parse_state, console)
         assert parts[0] == "add"  # Alias 'a' expanded to 'add'
 
-    @pytest.mark.parametrize(
-        "alias,expected",
-        [
-            ("a", "add"), ("e", "edit"), ("x", "done"), ("d", "done"),
-            ("u", "undone"), ("n", "next"), ("p", "prev"), ("s", "show"),
-            ("v", "view"), ("f", "filter"), ("t", "tags"), ("h", "help"),
-            ("q", "exit"), ("r", "remove"),
-        ],
-    )
-    def test_parse_all_single_letter_aliases(self, app_state, console, alias, expected):
-        """Test all single-letter command aliases (parametrized)"""
-        cmd, parts = parse_command(f"{alias} arg", app_state, console)
+    @pytest.mark.parametrize("alias,expected", [("a", "add")])
+    def test_parse_single_letter_alias(self, parse_state, console, alias, expected):
+        """Test a single-letter command alias (canary for the table test below)"""
+        cmd, parts = parse_command(f"{alias} arg", parse_state, console)
         assert parts[0] == expected
 
-    def test_parse_word_aliases(self, app_state, console):
+    def test_parse_all_single_letter_aliases(self, parse_state, console):
+        """Test all single-letter command aliases in one pass"""
+        for alias, expected in _ALIAS_CASES:
+            cmd, parts = parse_command(f"{alias} arg", parse_state, console)
+            assert parts[0] == expected, alias
+
+    def test_parse_word_aliases(self, parse_state, console):
         """Test word-based aliases (quit, delete, del)"""
         # quit → exit
-        cmd, parts = parse_command("quit", app_state, console)
+        cmd, parts = parse_command("quit", parse_state, console)
         assert parts[0] == "exit"
 
         # delete → remove
-        cmd, parts = parse_command("delete 1", app_state, console)
+        cmd, parts = parse_command("delete 1", parse_state, console)
         assert parts[0] == "remove"
 
         # del → remove
-        cmd, parts = parse_command("del 1", app_state, console)
+        cmd, parts = parse_command("del 1", parse_state, console)
         assert parts[0] == "remove"
 
-    def test_parse_case_insensitive(self, app_state, console):
+    def test_parse_case_insensitive(self, parse_state, console):
         """Test that commands are case-insensitive"""
-        cmd, parts = parse_command("ADD Task", app_state, console)
+        cmd, parts = parse_command("ADD Task", parse_state, console)
         # parse_command returns lowercase command
         assert parts[0].lower() == "add"
 
-        cmd, parts = parse_command("DeLeTe 1", app_state, console)
+        cmd, parts = parse_command("DeLeTe 1", parse_state, console)
         # Alias 'delete' maps to 'remove'
         assert cmd.lower() == "delete" or parts[0].lower() in ["delete", "remove"]
 
-    def test_parse_special_characters(self, app_state, console):
+    def test_parse_special_characters(self, parse_state, console):
         """Test parsing commands with special characters"""
-        cmd, parts = parse_command('add "Task @#$%"', app_state, console)
+        cmd, parts = parse_command('add "Task @#$%"', parse_state, console)
         assert parts[1] == "Task @#$%"
 
-    def test_parse_unicode_input(self, app_state, console):
+    def test_parse_unicode_input(self, parse_state, console):
         """Test parsing commands with Unicode characters"""
-        cmd, parts = parse_command('add "任务 🎉"', app_state, console)
+        cmd, parts = parse_command('add "任务 🎉"', parse_state, console)
         assert parts[1] == "任务 🎉"
 
-    def test_parse_backslash_in_quotes(self, app_state, console):
+    def test_parse_unquoted_matches_shlex(self, parse_state, console):
+        """Test the unquoted fast path tokenizes exactly like shlex.split"""
+        import shlex
+        for command in ["done 1 2\t3", "filter  tag=work\r\n", "add Task\x00Name", "show #1"]:
+            cmd, parts = parse_command(command, parse_state, console)
+            assert parts[1:] == shlex.split(command.strip())[1:]
+
+    def test_parse_backslash_in_quotes(self, parse_state, console):
         """Test parsing commands with backslashes"""
-        cmd, parts = parse_command(r'add "Path\\to\\file"', app_state, console)
+        cmd, parts = parse_command(r'add "Path\\to\\file"', parse_state, console)
         assert "Path" in parts[1]
 
 
@@ -184,18 +208,32 @@ class TestParseTaskIds:
         assert 2 in ids
 
 
-class TestHandleAdd:
-    """Test add command handler with comprehensive scenarios"""
+@pytest.fixture
+def add_case(request, app_state, console):
+    """AppState after running handle_add with the parametrized arguments"""
+    handle_add(request.param, app_state, console)
+    return app_state
 
-    def test_add_minimal_task(self, app_state, console):
-        """Test adding task with minimum required fields (name only)"""
-        initial_count = len(app_state.tasks)
 
-        handle_add(["add", "Simple Task"], app_state, console)
+class TestHandleAdd:
+    """Test add command handler with comprehensive scenarios"""
 
-        assert len(app_state.tasks) == initial_count + 1
-        task = app_state.tasks[-1]
-        assert task.name == "Simple Task"
+    @pytest.mark.parametrize(
+        "add_case,expected_name",
+        [
+            (["add", "Simple Task"], "Simple Task"),
+            (["add", "任务 🎉"], "任务 🎉"),
+            (["add", "Task @#$% & *()"], "Task @#$% & *()"),
+            pytest.param(["add", "A" * 1000], "A" * 1000, marks=pytest.mark.slow),
+        ],
+        ids=["minimal", "unicode_name", "special_characters", "very_long_name"],
+        indirect=["add_case"],
+    )
+    def test_add_task_name_only(self, add_case, expected_name):
+        """Test adding task with only a name (minimal, unicode, special chars, long)"""
+        assert len(add_case.tasks) == 1
+        task = add_case.tasks[-1]
+        assert task.name == expected_name
         assert task.comment == ""
         assert task.description == ""
 
@@ -236,50 +274,17 @@ class TestHandleAdd:
         assert len(task.tags) <= 3  # Max 3 tags
         assert "work" in task.tags
 
-    def test_add_task_unicode_name(self, app_state, console):
-        """Test adding task with Unicode name"""
-        handle_add(["add", "任务 🎉"], app_state, console)
-
-        task = app_state.tasks[-1]
-        assert task.name == "任务 🎉"
-
-    def test_add_task_special_characters(self, app_state, console):
-        """Test adding task with special characters"""
-        handle_add(["add", "Task @#$% & *()"], app_state, console)
-
-        task = app_state.tasks[-1]
-        assert "@#$%" in task.name
-
-    def test_add_task_very_long_name(self, app_state, console):
-        """Test adding task with very long name"""
-        long_name = "A" * 1000
-        handle_add(["add", long_name], app_state, console)
-
-        task = app_state.tasks[-1]
-        assert task.name == long_name
-
-    def test_add_task_invalid_priority(self, app_state, console):
-        """Test adding task with invalid priority (clamped)"""
-        try:
-            handle_add(["add", "Task", "", "", "99"], app_state, console)
-            if app_state.tasks:
-                task = app_state.tasks[-1]
-                # Priority should be clamped to valid range (1-3)
-                assert 1 <= task.priority <= 3
-        except (IndexError, ValueError):
-            # Expected - invalid priority may cause error
-            pass
-
-    def test_add_task_negative_priority(self, app_state, console):
-        """Test adding task with negative priority"""
-        try:
-            handle_add(["add", "Task", "", "", "-1"], app_state, console)
-            if app_state.tasks:
-                task = app_state.tasks[-1]
-                assert task.priority >= 1
-        except (IndexError, ValueError):
-            # Expected - negative priority may cause error
-            pass
+    @pytest.mark.parametrize(
+        "add_case",
+        [["add", "Task", "", "", "99"], ["add", "Task", "", "", "-1"]],
+        ids=["invalid_priority", "negative_priority"],
+        indirect=True,
+    )
+    def test_add_task_out_of_range_priority(self, add_case):
+        """Test adding task with out-of-range priority (rejected or clamped)"""
+        if add_case.tasks:
+            # Priority should be clamped to valid range (1-3)
+            assert 1 <= add_case.tasks[-1].priority <= 3
 
     def test_add_increments_id(self, app_state, console):
         """Test that adding tasks increments IDs correctly"""
@@ -308,16 +313,15 @@ class TestHandleDone:
         """Test marking multiple tasks as done"""
         handle_done(["done", "1", "2", "3"], state_with_tasks, console)
 
-        assert state_with_tasks.get_task_by_id(1).done is True
-        assert state_with_tasks.get_task_by_id(2).done is True
-        assert state_with_tasks.get_task_by_id(3).done is True
+        get_task = state_with_tasks.get_task_by_id
+        assert all(get_task(i).done is True for i in (1, 2, 3))
 
     def test_done_with_range(self, state_with_tasks, console):
         """Test marking range of tasks as done"""
         handle_done(["done", "1-3"], state_with_tasks, console)
 
-        for i in range(1, 4):
-            assert state_with_tasks.get_task_by_id(i).done is True
+        get_task = state_with_tasks.get_task_by_id
+        assert all(get_task(i).done is True for i in range(1, 4))
 
     def test_done_nonexistent_task(self, state_with_tasks, console):
         """Test marking nonexistent task as done"""
@@ -336,7 +340,7 @@ class TestHandleDone:
     def test_done_already_done_task(self, state_with_tasks, console):
         """Test marking already-done task as done (idempotent)"""
         task = state_with_tasks.get_task_by_id(1)
-        task.done = True
+        state_with_tasks.set_done(task, True)
 
         handle_done(["done", "1"], state_with_tasks, console)
 
@@ -358,7 +362,7 @@ class TestHandleUndone:
     def test_undone_single_task(self, state_with_tasks, console):
         """Test marking single task as undone"""
         task = state_with_tasks.get_task_by_id(1)
-        task.done = True
+        state_with_tasks.set_done(task, True)
 
         handle_undone(["undone", "1"], state_with_tasks, console)
 
@@ -366,18 +370,18 @@ class TestHandleUndone:
 
     def test_undone_multiple_tasks(self, state_with_tasks, console):
         """Test marking multiple tasks as undone"""
+        get_task = state_with_tasks.get_task_by_id
         for i in range(1, 4):
-            state_with_tasks.get_task_by_id(i).done = True
+            state_with_tasks.set_done(get_task(i), True)
 
         handle_undone(["undone", "1", "2", "3"], state_with_tasks, console)
 
-        for i in range(1, 4):
-            assert state_with_tasks.get_task_by_id(i).done is False
+        assert all(get_task(i).done is False for i in range(1, 4))
 
     def test_undone_clears_completed_timestamp(self, state_with_tasks, console):
         """Test that marking task as undone clears completed_at"""
         task = state_with_tasks.get_task_by_id(1)
-        task.done = True
+        state_with_tasks.set_done(task, True)
         task.completed_at = "2024-01-01T00:00:00"
 
         handle_undone(["undone", "1"], state_with_tasks, console)
@@ -414,7 +418,8 @@ class TestHandleCommandIntegration:
         # Should record a helpful message and keep state valid
         assert isinstance(app_state.tasks, list)
         assert app_state.messages, "Expected an error/help message for invalid command"
-        assert any("unknown" in str(m).lower() or "usage" in str(m).lower() for m in app_state.messages)
+        messages = [str(m).lower() for m in app_state.messages]
+        assert any("unknown" in m or "usage" in m for m in messages)
 
     def test_command_state_consistency(self, app_state, console):
         """Test that state remains consistent after commands"""
@@ -459,6 +464,7 @@ class TestCommandEdgeCases:
         handle_command("add Task\n\r\t", app_state, console)
         # Should sanitize or handle gracefully
 
+    @pytest.mark.slow
     def test_command_extremely_long_input(self, app_state, console):
         """Test command with extremely long input"""
         long_command = 'add "' + ("A" * 10000) + '"'
@@ -487,25 +493,9 @@ class TestCommandEdgeCases:
         if app_state.tasks:
             assert "nested" in app_state.tasks[-1].name
 
+    @pytest.mark.xfail(
+        reason="Command handler is single-threaded by design; concurrent calls are not supported.",
+        run=False,
+    )
     def test_concurrent_command_execution(self, app_state, console):
         """Test that commands maintain state consistency under naive threads (expected xfail)."""
-        import pytest as _pytest
-        _pytest.xfail("Command handler is single-threaded by design; concurrent calls are not supported.")
-        import threading
-        lock = threading.Lock()
-        created_ids = []
-
-        def add_task(n):
-            handle_command(f'add "Task {n}"', app_state, console)
-            with lock:
-                if app_state.tasks:
-                    created_ids.append(app_state.tasks[-1].id)
-
-        threads = [threading.Thread(target=add_task, args=(i,)) for i in range(5)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-        # Detect collisions if they occurred
-        assert len(created_ids) == len(set(created_ids))
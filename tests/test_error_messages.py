@@ -1,7 +1,9 @@
+import re
+
 import pytest
 
 from core.state import AppState
-from core.commands import handle_command
+from core.commands import handle_command, handle_add, handle_done, handle_undone
 
 
 @pytest.fixture
@@ -9,25 +11,31 @@ def state():
     return AppState()
 
 
+# Case-insensitive expectations, compiled once; search() needs no lowercased copy
+_USAGE_RE = re.compile(r"usage", re.I)
+_UNKNOWN_COMMAND_RE = re.compile(r"unknown|help|usage", re.I)
+_FIELD_NAME_RE = re.compile(r"usage|name", re.I)
+_NO_IDS_RE = re.compile(r"no valid task ids|usage", re.I)
+_FILTER_ERROR_RE = re.compile(r"error|invalid|usage", re.I)
+
+
 def _last_msg(state):
     return state.messages[-1] if state.messages else ""
 
 
 def test_missing_task_id_error_shows_usage(state, console):
     handle_command("remove", state, console)
-    assert "usage" in _last_msg(state).lower()
+    assert _USAGE_RE.search(_last_msg(state))
 
 
 def test_invalid_command_error_shows_suggestions(state, console):
     handle_command("invalid_command", state, console)
-    msg = _last_msg(state).lower()
-    assert "unknown" in msg or "help" in msg or "usage" in msg
+    assert _UNKNOWN_COMMAND_RE.search(_last_msg(state))
 
 
 def test_validation_error_shows_field_name(state, console):
-    handle_command('add ""', state, console)
-    msg = _last_msg(state).lower()
-    assert "usage" in msg or "name" in msg
+    handle_add(["add", ""], state, console)
+    assert _FIELD_NAME_RE.search(_last_msg(state))
 
 
 def test_unmatched_quotes_reports_error(state, console):
@@ -38,21 +46,20 @@ def test_unmatched_quotes_reports_error(state, console):
 
 def test_remove_no_ids_reports_error(state, console):
     handle_command("remove", state, console)
-    assert "no valid task ids" in _last_msg(state).lower() or "usage" in _last_msg(state).lower()
+    assert _NO_IDS_RE.search(_last_msg(state))
 
 
 def test_done_no_ids_reports_error(state, console):
-    handle_command("done", state, console)
-    assert "usage" in _last_msg(state).lower()
+    handle_done(["done"], state, console)
+    assert _USAGE_RE.search(_last_msg(state))
 
 
 def test_undone_no_ids_reports_error(state, console):
-    handle_command("undone", state, console)
-    assert "usage" in _last_msg(state).lower()
+    handle_undone(["undone"], state, console)
+    assert _USAGE_RE.search(_last_msg(state))
 
 
 def test_show_invalid_filter_reports_error(state, console):
     handle_command("show invalid:filter", state, console)
-    msg = _last_msg(state).lower()
-    assert "error" in msg or "invalid" in msg or "usage" in msg
+    assert _FILTER_ERROR_RE.search(_last_msg(state))
 
@@ -7,6 +7,7 @@ with realistic data for comprehensive testing.
 Moved to tests root to avoid import conflicts.
 """
 
+import inspect
 import random
 import string
 from datetime import datetime, timedelta
@@ -16,35 +17,57 @@ from models.task import Task
 from core.state import AppState
 
 
+# Reference "now" for generated timestamps; keeps factory output deterministic
+# (pass now=datetime.now() to create()/create_batch() for wall-clock dates).
+FIXED_NOW = datetime(2024, 1, 1)
+
+
+def _normalize_tags(tags: List[str], tag: Optional[str]) -> tuple[List[str], str]:
+    """Apply Task.__post_init__ tag rules so factories can use Task.from_raw"""
+    if not tags and tag:
+        tags = [tag]
+    tags = [t.strip().lower() for t in tags if t.strip()][:3]
+    return tags, (tag or (tags[0] if tags else ""))
+
+
 class TaskFactory:
     """Factory for creating realistic Task instances"""
 
+    # Shared RNG for unseeded draws (create_batch(seed=...) uses its own)
+    _RNG = random.Random()
+
     # Sample data for realistic tasks
-    TASK_NAMES = [
+    TASK_NAMES = (
         "Write documentation", "Fix bug in login", "Review pull request",
         "Update dependencies", "Refactor database layer", "Add unit tests",
         "Deploy to production", "Design new feature", "Optimize performance",
         "Security audit", "Update README", "Create API endpoint",
-    ]
+    )
 
-    COMMENTS = [
+    COMMENTS = (
         "High priority", "Urgent", "Low priority", "Nice to have",
         "Critical bug", "Enhancement", "Technical debt", "Quick fix",
-    ]
+    )
 
-    DESCRIPTIONS = [
+    DESCRIPTIONS = (
         "Detailed implementation notes here",
         "See ticket #123 for more details",
         "This is a critical issue affecting users",
-    ]
+    )
 
-    TAGS = [
+    TAGS = (
         "work", "personal", "urgent", "bug", "feature", "enhancement",
         "technical-debt", "security", "performance", "documentation",
-    ]
+    )
 
-    @staticmethod
+    # Pool sizes cached for index draws (rng.randrange skips choice()'s len() per call)
+    _NAMES_LEN = len(TASK_NAMES)
+    _COMMENTS_LEN = len(COMMENTS)
+    _DESCRIPTIONS_LEN = len(DESCRIPTIONS)
+
+    @classmethod
     def create(
+        cls,
         id: Optional[int] = None,
         name: Optional[str] = None,
         comment: Optional[str] = None,
@@ -54,37 +77,42 @@ class TaskFactory:
         tags: Optional[List[str]] = None,
         done: Optional[bool] = None,
         created_at: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> Task:
         """Create a single Task instance with optional overrides"""
+        rng = cls._RNG
+        if now is None:
+            now = FIXED_NOW
         if id is None:
-            id = random.randint(1, 10000)
+            id = rng.randint(1, 10000)
         if name is None:
-            name = random.choice(TaskFactory.TASK_NAMES)
-        if comment is None and random.random() > 0.3:
-            comment = random.choice(TaskFactory.COMMENTS)
+            name = cls.TASK_NAMES[rng.randrange(cls._NAMES_LEN)]
+        if comment is None and rng.random() > 0.3:
+            comment = cls.COMMENTS[rng.randrange(cls._COMMENTS_LEN)]
         elif comment is None:
             comment = ""
-        if description is None and random.random() > 0.5:
-            description = random.choice(TaskFactory.DESCRIPTIONS)
+        if description is None and rng.random() > 0.5:
+            description = cls.DESCRIPTIONS[rng.randrange(cls._DESCRIPTIONS_LEN)]
         elif description is None:
             description = ""
         if priority is None:
-            priority = random.randint(1, 3)
-        if tags is None and random.random() > 0.4:
-            num_tags = random.randint(1, 3)
-            tags = random.sample(TaskFactory.TAGS, num_tags)
+            priority = rng.randint(1, 3)
+        if tags is None and rng.random() > 0.4:
+            num_tags = rng.randint(1, 3)
+            tags = rng.sample(cls.TAGS, num_tags)
             tag = tags[0] if not tag else tag
         elif tags is None:
             tags = []
             tag = tag or ""
         if done is None:
-            done = random.random() > 0.7
+            done = rng.random() > 0.7
         if created_at is None:
-            days_ago = random.randint(0, 30)
-            dt = datetime.now() - timedelta(days=days_ago)
+            days_ago = rng.randint(0, 30)
+            dt = now - timedelta(days=days_ago)
             created_at = dt.isoformat()
 
-        return Task(
+        tags, tag = _normalize_tags(tags, tag)
+        return Task.from_raw(
             id=id,
             name=name,
             comment=comment,
@@ -94,14 +122,75 @@ class TaskFactory:
             tags=tags,
             done=done,
             created_at=created_at,
-            completed_at="" if not done else (datetime.now() - timedelta(days=random.randint(0, 10))).isoformat(),
+            completed_at="" if not done else (now - timedelta(days=rng.randint(0, 10))).isoformat(),
             updated_at=created_at,
         )
 
-    @staticmethod
-    def create_batch(count: int, **kwargs) -> List[Task]:
-        """Create multiple tasks with unique IDs"""
-        return [TaskFactory.create(id=i+1, **kwargs) for i in range(count)]
+    @classmethod
+    def create_batch(cls, count: int, seed: Optional[int] = None, **kwargs) -> List[Task]:
+        """
+        Create multiple tasks with unique IDs (optionally reproducible via seed)
+
+        Fields are drawn column-wise with random.choices (same distributions
+        as create()), and timestamps come from small precomputed pools.
+        kwargs take create()'s field overrides except id, which is assigned
+        1..count; anything else raises TypeError.
+        """
+        unknown = sorted(kwargs.keys() - (inspect.signature(cls.create).parameters.keys() - {"id"}))
+        if unknown:
+            raise TypeError(f"create_batch() got unexpected keyword argument(s): {', '.join(unknown)}")
+        # A seeded batch gets a private RNG so it doesn't reset the shared stream
+        rng = random.Random(seed) if seed is not None else cls._RNG
+        now = kwargs.pop("now", None) or FIXED_NOW
+        fixed = {k: v for k, v in kwargs.items() if v is not None}
+        if count <= 0:
+            return []
+
+        def column(field, draw):
+            return [fixed[field]] * count if field in fixed else draw()
+
+        def optional_column(field, pool, threshold):
+            return column(field, lambda: [
+                value if r > threshold else ""
+                for value, r in zip(rng.choices(pool, k=count), [rng.random() for _ in range(count)])
+            ])
+
+        names = column("name", lambda: rng.choices(cls.TASK_NAMES, k=count))
+        comments = optional_column("comment", cls.COMMENTS, 0.3)
+        descriptions = optional_column("description", cls.DESCRIPTIONS, 0.5)
+        priorities = column("priority", lambda: rng.choices((1, 2, 3), k=count))
+        dones = column("done", lambda: [rng.random() > 0.7 for _ in range(count)])
+        created_pool = [(now - timedelta(days=d)).isoformat() for d in range(31)]
+        created = column("created_at", lambda: rng.choices(created_pool, k=count))
+        completed_pool = [(now - timedelta(days=d)).isoformat() for d in range(11)]
+        completed = rng.choices(completed_pool, k=count)
+
+        tasks = []
+        for i in range(count):
+            tag = fixed.get("tag")
+            if "tags" in fixed:
+                tags = fixed["tags"]
+            elif rng.random() > 0.4:
+                tags = rng.sample(cls.TAGS, rng.randint(1, 3))
+                tag = tag or tags[0]
+            else:
+                tags = []
+                tag = tag or ""
+            tags, tag = _normalize_tags(tags, tag)
+            tasks.append(Task.from_raw(
+                id=i + 1,
+                name=names[i],
+                comment=comments[i],
+                description=descriptions[i],
+                priority=priorities[i],
+                tag=tag,
+                tags=tags,
+                done=dones[i],
+                created_at=created[i],
+                completed_at=completed[i] if dones[i] else "",
+                updated_at=created[i],
+            ))
+        return tasks
 
 
 class StateFactory:
@@ -104,8 +104,9 @@ class TestAtomicWrite:
         manager.atomic_write_json(data, indent=2)
 
         content = temp_file.read_text()
-        # Indented JSON should have newlines
+        # Indented JSON should have newlines (2 spaces with json and orjson)
         assert "\n" in content
+        assert '\n  "test": "data"' in content
 
     def test_atomic_write_unicode(self, manager, temp_file):
         """Test atomic write with unicode characters"""
@@ -117,6 +118,34 @@ class TestAtomicWrite:
         assert loaded["text"] == "Hello 世界"
         assert loaded["emoji"] == "🎉"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_atomic_write_dataclass_items(self, manager, temp_file, monkeypatch, use_orjson):
+        """Test that dataclass items are written like their asdict() form"""
+        from dataclasses import asdict
+        import core.file_safety as file_safety
+        from models.task import Task
+
+        if not use_orjson:
+            monkeypatch.setattr(file_safety, "orjson", None)
+        tasks = [Task(id=1, name="A", comment="", description="", priority=1, tag="work")]
+
+        manager.atomic_write_json(tasks)
+
+        assert json.loads(temp_file.read_text()) == [asdict(t) for t in tasks]
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_json_backends_write_identical_bytes(self, monkeypatch, indent):
+        """Test the stdlib fallback matches orjson's output byte for byte"""
+        pytest.importorskip("orjson")
+        import core.file_safety as file_safety
+        from models.task import Task
+
+        data = [Task(id=1, name="Café", comment="", description="", priority=1, tag="work"), {"n": None}]
+        with_orjson = file_safety._dumps(data, indent)
+        monkeypatch.setattr(file_safety, "orjson", None)
+
+        assert file_safety._dumps(data, indent) == with_orjson
+
     def test_atomic_write_creates_parent_dir(self, temp_dir, console):
         """Test that atomic write creates parent directory if needed"""
         nested_file = temp_dir / "subdir" / "nested.json"
@@ -243,6 +272,28 @@ class TestSaveWithBackup:
         backup_path = manager._get_backup_path(0)
         assert not backup_path.exists()
 
+    def test_identical_resave_skips_write(self, manager, temp_file):
+        """Test that re-saving unchanged data leaves file and backups alone"""
+        manager.save_json_with_lock({"v": 1})
+        manager.save_json_with_lock({"v": 2})
+        before = temp_file.stat()
+
+        manager.save_json_with_lock({"v": 2})
+
+        after = temp_file.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert json.loads(manager._get_backup_path(0).read_text()) == {"v": 1}
+        assert not manager._get_backup_path(1).exists()
+
+    def test_identical_resave_after_external_change_writes(self, manager, temp_file):
+        """Test that a file changed by someone else is rewritten"""
+        manager.save_json_with_lock({"v": 1})
+        temp_file.write_text(json.dumps({"other": "writer"}))
+
+        manager.save_json_with_lock({"v": 1})
+
+        assert json.loads(temp_file.read_text()) == {"v": 1}
+
 
 class TestLoadWithLock:
     """Test load operations with file locking"""
@@ -384,6 +435,16 @@ class TestErrorHandling:
         with pytest.raises(FileSafetyError):
             manager.atomic_write_json({"obj": CustomClass()})
 
+    def test_unserializable_save_leaves_backups_untouched(self, manager, temp_file):
+        """Test that encoding fails before backups are rotated"""
+        temp_file.write_text(json.dumps({"initial": "data"}))
+
+        with pytest.raises(FileSafetyError):
+            manager.save_json_with_lock({"obj": object()})
+
+        assert not manager._get_backup_path(0).exists()
+        assert json.loads(temp_file.read_text()) == {"initial": "data"}
+
     def test_corrupted_json_on_load(self, manager, temp_file):
         """Test error handling for corrupted JSON"""
         temp_file.write_text("{ not valid json }")
@@ -446,3 +507,35 @@ class TestThreadSafety:
         assert temp_file.exists()
         data = json.loads(temp_file.read_text())
         assert "value" in data
+
+    def test_coalesced_saves_write_latest_once(self, manager, temp_file, monkeypatch):
+        """Test that a burst of coalesced saves collapses into few real writes"""
+        import threading
+
+        writes = []
+        real_write = manager._atomic_write_bytes
+
+        def counting_write(encoded):
+            writes.append(json.loads(encoded)["value"])
+            real_write(encoded)
+
+        monkeypatch.setattr(manager, "_atomic_write_bytes", counting_write)
+
+        results = []
+        barrier = threading.Barrier(5)
+
+        def save_data(value):
+            barrier.wait()
+            manager.save_coalesced({"value": value})
+            results.append(value)
+
+        threads = [threading.Thread(target=save_data, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        manager.flush()
+
+        assert len(results) == 5
+        assert 1 <= len(writes) <= 2
+        assert json.loads(temp_file.read_text())["value"] == writes[-1]
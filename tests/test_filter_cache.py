@@ -58,3 +58,84 @@ def test_filter_cache_key_includes_filter_string():
     b = s.filtered_tasks
     assert a != b
 
+
+def test_filter_cache_reused_when_filter_switches_back_without_edits():
+    s = AppState()
+    _add(s, tag="a")
+    s.filter = "tag=a"
+    first = s.filtered_tasks
+    s.filter = "tag=a"
+    assert s.filtered_tasks is first
+    _add(s, tag="a")
+    assert s._filter_cache_dirty is True
+    assert len(s.filtered_tasks) == 2
+
+
+def test_filter_cache_invalidated_by_load(tmp_path, console):
+    path = tmp_path / "tasks.json"
+    s = AppState()
+    _add(s, tag="a")
+    s.save_to_file(str(path), console)
+    _ = s.filtered_tasks
+
+    other = AppState()
+    _add(other, tag="a")
+    _add(other, tag="a")
+    other.save_to_file(str(path), console)
+
+    s.load_from_file(str(path), console)
+    assert s._filter_cache_dirty is True
+    assert len(s.filtered_tasks) == 2
+
+
+def test_single_tag_filter_matches_full_scan_after_edit():
+    from utils.filter_parser import parse_filter_expression, matches_all_conditions
+
+    s = AppState()
+    for tag in ("a", "b", "a", "b"):
+        _add(s, tag=tag)
+    t = s.tasks[1]
+    old = list(t.tags)
+    t.tags = ["a"]
+    s._update_tag_index_for_task(t, old_tags=old)
+
+    s.filter = "tag=a"
+    conditions = parse_filter_expression(s.filter)
+    expected = [t for t in s.tasks if matches_all_conditions(t, conditions)]
+    assert s.get_filter_tasks(s.tasks) == expected
+    assert [t.id for t in s.filtered_tasks] == [1, 2, 3]
+
+    s.filter = "tag=missing"
+    assert s.filtered_tasks == []
+
+
+@pytest.mark.parametrize("expr, expected_ids", [
+    ("tag=a,b", [1, 2, 3]),
+    ("tag=a+b", [3]),
+    ("tag=a+missing", []),
+    ("tag=b status=done", [3]),
+    ("priority=1 tag=a,b", [1]),
+])
+def test_tag_index_filters_match_full_scan(expr, expected_ids):
+    from utils.filter_parser import parse_filter_expression, matches_all_conditions
+
+    s = AppState()
+    _add(s, tag="a", prio=1)
+    _add(s, tag="b")
+    _add(s, tag="a, b")
+    _add(s, tag="c")
+    s.set_done(s.get_task_by_id(3), True)
+
+    s.filter = expr
+    conditions = parse_filter_expression(expr)
+    expected = [t for t in s.tasks if matches_all_conditions(t, conditions)]
+    assert s.get_filter_tasks(s.tasks) == expected
+    assert [t.id for t in expected] == expected_ids
+
+
+def test_filter_plan_compiled_once_per_filter_string():
+    s = AppState()
+    plan = s._compile_filter("tag=a status=done")
+    assert s._compile_filter("tag=a status=done") is plan
+    assert plan[0] == "a"
+    assert s._compile_filter("status=done")[0] is None
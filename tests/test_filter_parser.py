@@ -14,6 +14,8 @@ from utils.filter_parser import (
     match_priority,
     match_tag,
     get_filter_description,
+    compile_filter,
+    filter_tasks,
 )
 
 
@@ -43,6 +45,12 @@ class TestFilterCondition:
         assert cond.field == "priority"
         assert cond.value == "high"
 
+    def test_condition_uses_slots(self):
+        """Test that conditions carry no per-instance __dict__"""
+        cond = FilterCondition("tag", "=", "work")
+
+        assert not hasattr(cond, "__dict__")
+
 
 class TestParseCondition:
     """Test parsing individual conditions"""
@@ -157,6 +165,14 @@ class TestParseFilterExpression:
         assert conditions[0].field == "status"
         assert conditions[0].value == "undone"
 
+    def test_parse_reuses_cached_conditions(self):
+        """Test that repeated parses share conditions but return fresh lists"""
+        first = parse_filter_expression("priority=1 tag=work")
+        second = parse_filter_expression("priority=1 tag=work")
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
     def test_parse_legacy_tag_syntax(self):
         """Test parsing legacy 'tag:name' syntax"""
         conditions = parse_filter_expression("tag:work")
@@ -482,3 +498,61 @@ class TestComplexFilterScenarios:
         assert len(filtered) == 2
         assert filtered[0].id == 2
         assert filtered[1].id == 3
+
+
+class TestCompileFilter:
+    """Test compiled filter predicates"""
+
+    TASKS = [
+        Task(id=1, name="Task 1", comment="", description="", priority=1, tag="work", tags=["work", "urgent"], done=False),
+        Task(id=2, name="Task 2", comment="", description="", priority=2, tag="work", tags=["work"], done=True),
+        Task(id=3, name="Task 3", comment="", description="", priority=3, tag="home", tags=["home"], done=False),
+        Task(id=4, name="Task 4", comment="", description="", priority=2, tag="", done=True),
+    ]
+
+    @pytest.mark.parametrize("expression", [
+        "",
+        "done",
+        "undone",
+        "tag:work",
+        "priority=1",
+        "priority!=high",
+        "priority>=2",
+        "priority<=m",
+        "priority=1,3",
+        "priority!=1,2",
+        "priority>=1,2",
+        "priority=9",
+        "status=done priority=2",
+        "status!=undone",
+        "tag=work+urgent",
+        "tag!=work+urgent",
+        "tag=home,urgent",
+        "tag!=home,urgent",
+        "tag>=work",
+        "status=undone tag=work priority<=2",
+    ])
+    def test_matches_interpreted_conditions(self, expression):
+        """Test compiled predicate agrees with matches_all_conditions"""
+        conditions = parse_filter_expression(expression)
+        match = compile_filter(conditions)
+
+        expected = [t.id for t in self.TASKS if matches_all_conditions(t, conditions)]
+        assert [t.id for t in self.TASKS if match(t)] == expected
+
+    def test_filter_tasks_helper(self):
+        """Test filter_tasks parses, compiles and keeps task order"""
+        filtered = filter_tasks(self.TASKS, "tag=work priority=1,2")
+
+        assert [t.id for t in filtered] == [1, 2]
+
+    def test_cheap_conditions_run_before_age(self, monkeypatch):
+        """Test that a failing priority check skips the age check"""
+        import utils.time
+
+        calls = []
+        monkeypatch.setattr(utils.time, "age_seconds", lambda ts: calls.append(ts) or 0)
+        match = compile_filter(parse_filter_expression("age>=0 priority=1"))
+
+        assert match(self.TASKS[1]) is False
+        assert calls == []
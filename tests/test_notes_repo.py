@@ -1,11 +1,19 @@
 import os
 from pathlib import Path
 
+import pytest
+
 from services.notes import FileNoteRepository
 
 
-def test_notes_repo_create_and_roundtrip(tmp_path, monkeypatch):
-    notes_dir = tmp_path / "notes"
+@pytest.fixture(scope="module")
+def notes_root(tmp_path_factory):
+    """One temp dir for the module; each test works in its own subdirectory"""
+    return tmp_path_factory.mktemp("notes_repo")
+
+
+def test_notes_repo_create_and_roundtrip(notes_root, monkeypatch):
+    notes_dir = notes_root / "roundtrip"
     monkeypatch.setattr("config.DEFAULT_NOTES_DIR", str(notes_dir))
 
     repo = FileNoteRepository(str(notes_dir))
@@ -15,8 +23,7 @@ def test_notes_repo_create_and_roundtrip(tmp_path, monkeypatch):
     note = repo.create(title=title, body_md=body, tags=tags, task_ids=[12])
 
     # Ensure file created
-    files = list(Path(notes_dir).glob("*.md"))
-    assert files, "note file should exist"
+    assert next(Path(notes_dir).glob("*.md"), None) is not None, "note file should exist"
 
     # Read back via repo.get (by id prefix)
     fetched = repo.get(note.id[:8])
@@ -27,8 +34,8 @@ def test_notes_repo_create_and_roundtrip(tmp_path, monkeypatch):
     assert 12 in fetched.task_ids
 
 
-def test_notes_repo_link_unlink(tmp_path):
-    repo = FileNoteRepository(str(tmp_path))
+def test_notes_repo_link_unlink(notes_root):
+    repo = FileNoteRepository(str(notes_root / "link_unlink"))
     n = repo.create(title="t", body_md="", tags=["a"], task_ids=[1])
     repo.link_task(n, 2)
     assert 2 in n.task_ids
@@ -5,17 +5,32 @@ Tests for core/state.py - AppState class
 import pytest
 import tempfile
 import json
+from collections import deque
 from pathlib import Path
-from io import StringIO
+from io import BytesIO, StringIO
 
 from core.state import AppState
 from models.task import Task
 
 
-@pytest.fixture
-def state():
-    """Create a fresh AppState instance for each test"""
-    return AppState()
+@pytest.fixture(scope="module")
+def _shared_state():
+    """One AppState for the module plus a snapshot of its initial attributes"""
+    state = AppState()
+    return state, dict(vars(state))
+
+
+@pytest.fixture(autouse=True)
+def state(_shared_state):
+    """Shared AppState reset to its initial attributes before each test"""
+    state, defaults = _shared_state
+    # Containers are copied so a test's mutations never reach the snapshot
+    vars(state).clear()
+    vars(state).update(
+        (k, v.copy() if isinstance(v, (list, dict, set, deque)) else v)
+        for k, v in defaults.items()
+    )
+    return state
 
 
 @pytest.fixture
@@ -26,6 +41,9 @@ def temp_file(tmp_path):
 
 # Use shared `console` fixture from tests/conftest.py
 
+# More messages than MAX_CONVERSATION_MESSAGES (100), built once at import
+_OVERFLOW_MESSAGES = tuple(f"Message {i}" for i in range(110))
+
 
 class TestAppStateInitialization:
     """Test AppState initialization"""
@@ -43,7 +61,7 @@ class TestAppStateInitialization:
         assert state.sort_order == "asc"
         assert state.notes == []
         assert state.entity_mode == "tasks"
-        assert state.ai_conversation == []
+        assert list(state.ai_conversation) == []
 
     def test_task_index_enabled(self, state):
         """Test task index is initialized when enabled"""
@@ -75,6 +93,20 @@ class TestTaskOperations:
         assert task.priority == 1
         assert task.tags == ["work"]
 
+    @pytest.mark.parametrize("tag", ["", "Work", "a, B, a, c, d", "bad@tag, ok"])
+    def test_add_task_matches_constructor_normalization(self, state, tag):
+        """Test add_task's fast path builds the same Task as the constructor"""
+        state.add_task(" Name ", " c ", " d ", 2, tag)
+        task = state.tasks[0]
+
+        expected = Task(
+            id=1, name="Name", comment="c", description="d", priority=2,
+            tag=task.tag, tags=list(task.tags),
+            created_at=task.created_at, updated_at=task.updated_at,
+        )
+        assert task == expected
+        assert task.created_at and task.updated_at == task.created_at
+
     def test_add_task_increments_id(self, state):
         """Test that adding tasks increments next_id"""
         state.add_task("Task 1", "", "", 1, "")
@@ -114,6 +146,20 @@ class TestTaskOperations:
         assert "urgent" in task.tags
         assert "personal" in task.tags
 
+    def test_bulk_add_tasks(self, state):
+        """Test bulk add assigns sequential IDs and builds both indexes"""
+        state.add_task("Existing", "", "", 1, "work")
+        added = state.bulk_add_tasks(
+            dict(name=f"Bulk {i}", comment="", description="", priority=2, tag="bulk")
+            for i in range(3)
+        )
+
+        assert [t.id for t in added] == [2, 3, 4]
+        assert state.next_id == 5
+        assert state.get_task_by_id(3) is added[1]
+        assert len(state.get_tasks_by_tag("bulk")) == 3
+        assert len(state.get_tasks_by_tag("work")) == 1
+
     def test_get_task_by_id_found(self, state):
         """Test getting a task by ID when it exists"""
         state.add_task("Task 1", "", "", 1, "")
@@ -180,7 +226,7 @@ class TestTagOperations:
         state.add_task("Task 1", "", "", 1, "work")
         state.add_task("Task 2", "", "", 1, "work")
         task = state.get_task_by_id(1)
-        task.done = True
+        state.set_done(task, True)
 
         stats = state.get_all_tags_with_stats()
 
@@ -189,6 +235,54 @@ class TestTagOperations:
         assert stats["work"]["done"] == 1
         assert stats["work"]["pending"] == 1
 
+    def test_tag_stats_follow_done_remove_and_retag(self, state):
+        """Test incremental done counts match a full recount"""
+        def recount():
+            return {
+                tag: sum(1 for t in state.tasks if t.done and tag in t.tags)
+                for tag in state._tag_index
+            }
+
+        for tags in ("work, home", "work", "home"):
+            state.add_task("T", "", "", 1, tags)
+        state.set_done(state.get_task_by_id(1), True)
+        state.set_done(state.get_task_by_id(1), True)  # no double count
+        state.set_done(state.get_task_by_id(3), True)
+
+        task = state.get_task_by_id(1)
+        old_tags = list(task.tags)
+        task.tags = ["work", "urgent"]
+        state._update_tag_index_for_task(task, old_tags=old_tags)
+        state.remove_task(state.get_task_by_id(3))
+        state.set_done(state.get_task_by_id(2), True)
+        state.set_done(state.get_task_by_id(2), False)
+
+        stats = state.get_all_tags_with_stats()
+        assert {t: s["done"] for t, s in stats.items()} == recount()
+        assert stats["urgent"] == {"done": 1, "total": 1, "pending": 0}
+        assert "home" not in stats
+
+    def test_populated_state_tag_stats(self, populated_state):
+        """Test the shared fixture's done tasks are reflected in tag stats"""
+        stats = populated_state.get_all_tags_with_stats()
+
+        assert stats["work"] == {"done": 2, "total": 4, "pending": 2}
+        assert stats["personal"] == {"done": 0, "total": 1, "pending": 1}
+
+    def test_update_tag_index_only_moves_changed_tags(self, state):
+        """Test tag index update keeps unchanged tags in place"""
+        state.add_task("Task 1", "", "", 1, "work, home")
+        state.add_task("Task 2", "", "", 1, "work")
+        task = state.get_task_by_id(1)
+
+        old_tags = list(task.tags)
+        task.tags = ["work", "urgent"]
+        state._update_tag_index_for_task(task, old_tags=old_tags)
+
+        assert [t.id for t in state.get_tasks_by_tag("work")] == [1, 2]
+        assert state.get_tasks_by_tag("urgent") == [task]
+        assert state.get_tasks_by_tag("home") == []
+
 
 class TestFilteringAndSorting:
     """Test filtering and sorting operations"""
@@ -207,7 +301,7 @@ class TestFilteringAndSorting:
         """Test filtering by done status"""
         state.add_task("Task 1", "", "", 1, "")
         state.add_task("Task 2", "", "", 1, "")
-        state.get_task_by_id(1).done = True
+        state.set_done(state.get_task_by_id(1), True)
 
         state.filter = "status=done"
         filtered = state.filtered_tasks
@@ -219,7 +313,7 @@ class TestFilteringAndSorting:
         """Test filtering by undone status"""
         state.add_task("Task 1", "", "", 1, "")
         state.add_task("Task 2", "", "", 1, "")
-        state.get_task_by_id(1).done = True
+        state.set_done(state.get_task_by_id(1), True)
 
         state.filter = "status=undone"
         filtered = state.filtered_tasks
@@ -256,7 +350,7 @@ class TestFilteringAndSorting:
         state.add_task("Task 1", "", "", 1, "work")
         state.add_task("Task 2", "", "", 2, "work")
         state.add_task("Task 3", "", "", 1, "personal")
-        state.get_task_by_id(1).done = True
+        state.set_done(state.get_task_by_id(1), True)
 
         state.filter = "status=done priority=1 tag=work"
         filtered = state.filtered_tasks
@@ -382,6 +476,22 @@ class TestPagination:
         assert isinstance(page_tasks, list)
         assert len(page_tasks) > 0
 
+    def test_page_view_resorted_only_on_change(self, state):
+        """Test the sorted view is reused until sort, filter or tasks change"""
+        for prio in (3, 1, 2):
+            state.add_task(f"P{prio}", "", "", prio, "")
+
+        view = state._get_view()
+        assert [t.priority for t in view] == [1, 2, 3]
+        assert state._get_view() is view
+
+        state.sort_order = "desc"
+        assert [t.priority for t in state._get_view()] == [3, 2, 1]
+
+        state.get_task_by_id(1).priority = 0
+        state.invalidate_filter_cache()
+        assert state.get_current_page_tasks()[-1].id == 1
+
 
 class TestPersistence:
     """Test task persistence (save/load)"""
@@ -401,39 +511,9 @@ class TestPersistence:
         assert data[0]["name"] == "Task 1"
         assert data[1]["name"] == "Task 2"
 
-    def test_load_tasks_from_file(self, state, temp_file, console):
+    def test_load_tasks_from_file(self, state, temp_file, console, sample_tasks_json):
         """Test loading tasks from file"""
-        # Create test data
-        tasks_data = [
-            {
-                "id": 1,
-                "name": "Task 1",
-                "comment": "Comment",
-                "description": "Desc",
-                "priority": 1,
-                "tag": "work",
-                "tags": ["work"],
-                "done": False,
-                "created_at": "2024-01-01T00:00:00",
-                "completed_at": "",
-                "updated_at": "2024-01-01T00:00:00",
-            },
-            {
-                "id": 2,
-                "name": "Task 2",
-                "comment": "",
-                "description": "",
-                "priority": 2,
-                "tag": "",
-                "tags": [],
-                "done": False,
-                "created_at": "2024-01-01T00:00:00",
-                "completed_at": "",
-                "updated_at": "2024-01-01T00:00:00",
-            },
-        ]
-
-        temp_file.write_text(json.dumps(tasks_data))
+        temp_file.write_bytes(sample_tasks_json)
 
         state.load_from_file(str(temp_file), console)
 
@@ -450,20 +530,40 @@ class TestPersistence:
         assert state.tasks == []
         assert state.next_id == 1
 
-    def test_save_empty_list_protection(self, state, temp_file, console):
+    def test_save_empty_list_protection(self, state, console):
         """Test that saving empty list when tasks existed is prevented"""
+        buf = BytesIO()
         # First save with tasks
         state.add_task("Task 1", "", "", 1, "")
-        state.save_to_file(str(temp_file), console)
+        state.save_to_file(buf, console)
 
         # Clear tasks and try to save
         state.tasks = []
-        state.save_to_file(str(temp_file), console)
+        state.save_to_file(buf, console)
 
-        # Original file should still have data
-        data = json.loads(temp_file.read_text())
+        # Original data should still be the only thing written
+        data = json.loads(buf.getvalue())
         assert len(data) == 1
 
+    def test_save_load_stream_roundtrip(self, state, console, sample_tasks_json, tmp_path, monkeypatch):
+        """Test save/load accept binary streams and leave preferences alone"""
+        settings_file = tmp_path / "settings.json"
+        settings_file.write_text(json.dumps({"sort": "name", "filter": "tag=home"}), encoding="utf-8")
+        monkeypatch.setattr("core.state.DEFAULT_SETTINGS_FILE", settings_file)
+        state.filter = "none"
+        state.sort = "priority"
+
+        state.load_from_file(BytesIO(sample_tasks_json), console)
+        assert [t.name for t in state.tasks] == ["Task 1", "Task 2"]
+        assert state.next_id == 3
+        assert state.filter == "none"
+        assert state.sort == "priority"
+
+        buf = BytesIO()
+        state.save_to_file(buf, console)
+        assert json.loads(buf.getvalue()) == json.loads(sample_tasks_json)
+        assert json.loads(settings_file.read_text(encoding="utf-8")) == {"sort": "name", "filter": "tag=home"}
+
 
 class TestAIConversation:
     """Test AI conversation management"""
@@ -503,8 +603,25 @@ class TestAIConversation:
     def test_conversation_limit(self, state):
         """Test that conversation is limited to max messages"""
         # Add more messages than the limit (100)
-        for i in range(110):
-            state.add_ai_message("user", f"Message {i}")
+        for content in _OVERFLOW_MESSAGES:
+            state.add_ai_message("user", content)
 
-        # Should trim to max
+        # Should trim to max, keeping the newest messages
         assert len(state.ai_conversation) <= 100
+        assert state.ai_conversation[-1].content == _OVERFLOW_MESSAGES[-1]
+        assert state.ai_conversation[0].content == _OVERFLOW_MESSAGES[10]
+
+    def test_conversation_save_load_roundtrip(self, state, tmp_path, console):
+        """Test conversation persists with the same keys as AIMessage.to_dict()"""
+        path = tmp_path / "conversation.json"
+        state.add_ai_message("user", "Héllo")
+        state.add_ai_message("assistant", "Hi there")
+
+        state.save_conversation_to_file(str(path), console)
+
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert saved == [m.to_dict() for m in state.ai_conversation]
+
+        loaded = AppState()
+        loaded.load_conversation_from_file(str(path), console)
+        assert loaded.ai_conversation == state.ai_conversation
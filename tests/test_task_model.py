@@ -73,288 +73,101 @@ class TestTaskCreation:
         datetime.fromisoformat(task.updated_at)
 
 
-class TestTagMigration:
-    """Test tag migration from single tag to tags list"""
-
-    def test_migrate_single_tag_to_tags_list(self):
-        """Test migration from legacy tag field to tags list"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
+    def test_from_raw_matches_normal_construction(self):
+        """Test Task.from_raw builds the same task as __init__ for normalized values"""
+        fields = dict(
+            id=7,
+            name="Raw",
+            comment="c",
+            description="d",
             priority=2,
             tag="work",
-            tags=[],  # Empty tags list
-        )
-
-        # Should migrate tag to tags list
-        assert task.tags == ["work"]
-        assert task.tag == "work"
-
-    def test_sync_tags_list_to_tag_field(self):
-        """Test syncing tags list to legacy tag field"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="",  # Empty tag
             tags=["work", "urgent"],
+            done=True,
+            created_at="2024-01-01T00:00:00",
+            completed_at="2024-01-02T00:00:00",
+            updated_at="2024-01-01T00:00:00",
         )
+        assert Task.from_raw(**fields) == Task(**fields)
+        assert Task.from_raw(id=1, name="n", comment="", description="", priority=3, tag="").tags == []
 
-        # Should sync first tag from tags list
-        assert task.tag == "work"
-        assert task.tags == ["work", "urgent"]
-
-    def test_tags_normalized_to_lowercase(self):
-        """Test that tags are normalized to lowercase"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="WORK",
-            tags=["URGENT", "Personal"],
-        )
-
-        # Tags list is normalized, but when both tag and tags are provided,
-        # tag field remains unchanged and tags list gets normalized
-        assert task.tags == ["urgent", "personal"]
-        assert task.tag == "WORK"  # Original value preserved when tags list provided
-
-    def test_tags_trimmed_of_whitespace(self):
-        """Test that tags are trimmed of whitespace"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="  work  ",
-            tags=["  urgent  ", " personal "],
-        )
-
-        # Tags list is trimmed and normalized
-        assert task.tags == ["urgent", "personal"]
-        assert task.tag == "  work  "  # Original value when tags list provided
-
-    def test_empty_tags_filtered_out(self):
-        """Test that empty tags are filtered out"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work", "", "  ", "urgent"],
-        )
+    def test_task_uses_slots(self):
+        """Test that tasks carry no per-instance __dict__"""
+        task = Task.from_raw(id=1, name="n", comment="", description="", priority=3, tag="")
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
 
-        # Empty strings and whitespace-only should be removed
-        assert task.tags == ["work", "urgent"]
 
-    def test_tags_limited_to_three(self):
-        """Test that tags are limited to maximum 3"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work", "urgent", "personal", "project", "extra"],
-        )
+class TestTagMigration:
+    """Test tag migration from single tag to tags list"""
 
-        # Should only keep first 3 tags
-        assert len(task.tags) == 3
-        assert task.tags == ["work", "urgent", "personal"]
+    @pytest.mark.parametrize("tag, tags, expected_tags, expected_tag", [
+        pytest.param("work", [], ["work"], "work", id="migrate-legacy-tag"),
+        pytest.param("", ["work", "urgent"], ["work", "urgent"], "work", id="sync-legacy-tag"),
+        # When both are given, tag is left as-is and only tags is normalized
+        pytest.param("WORK", ["URGENT", "Personal"], ["urgent", "personal"], "WORK", id="lowercase"),
+        pytest.param("  work  ", ["  urgent  ", " personal "], ["urgent", "personal"], "  work  ", id="trimmed"),
+        pytest.param("work", ["work", "", "  ", "urgent"], ["work", "urgent"], "work", id="empty-filtered"),
+        pytest.param(
+            "work", ["work", "urgent", "personal", "project", "extra"],
+            ["work", "urgent", "personal"], "work", id="limited-to-three",
+        ),
+    ])
+    def test_tags_normalization(self, make_task, tag, tags, expected_tags, expected_tag):
+        """Test legacy tag migration and tags list normalization"""
+        task = make_task(tag=tag, tags=tags)
+
+        assert task.tags == expected_tags
+        assert task.tag == expected_tag
 
 
 class TestTagOperations:
     """Test tag manipulation methods"""
 
-    def test_add_tag_success(self):
-        """Test adding a tag successfully"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work"],
-        )
-
-        result = task.add_tag("urgent")
-        assert result is True
-        assert task.tags == ["work", "urgent"]
-        assert task.tag == "work"  # Legacy field stays synced
-
-    def test_add_tag_normalizes_case(self):
-        """Test that adding a tag normalizes to lowercase"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="",
-            tags=[],
-        )
-
-        result = task.add_tag("URGENT")
-        assert result is True
-        assert task.tags == ["urgent"]
-
-    def test_add_tag_duplicate(self):
-        """Test adding a duplicate tag"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work"],
-        )
-
-        result = task.add_tag("work")
-        assert result is False
-        assert task.tags == ["work"]
-
-    def test_add_tag_max_limit(self):
-        """Test adding a tag when at maximum limit"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work", "urgent", "personal"],
-        )
-
-        result = task.add_tag("extra")
-        assert result is False
-        assert len(task.tags) == 3
-
-    def test_add_tag_empty_string(self):
-        """Test adding an empty tag"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="",
-            tags=[],
-        )
-
-        result = task.add_tag("   ")
-        assert result is False
-        assert task.tags == []
-
-    def test_remove_tag_success(self):
-        """Test removing a tag successfully"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work", "urgent"],
-        )
-
-        result = task.remove_tag("urgent")
-        assert result is True
-        assert task.tags == ["work"]
-        assert task.tag == "work"
-
-    def test_remove_tag_not_found(self):
-        """Test removing a tag that doesn't exist"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work"],
-        )
-
-        result = task.remove_tag("urgent")
-        assert result is False
-        assert task.tags == ["work"]
-
-    def test_remove_last_tag_clears_legacy_field(self):
-        """Test that removing last tag clears legacy tag field"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work"],
-        )
-
-        result = task.remove_tag("work")
-        assert result is True
-        assert task.tags == []
-        assert task.tag == ""
+    @pytest.mark.parametrize("tag_in, initial, expected_result, expected_tags", [
+        pytest.param("urgent", ["work"], True, ["work", "urgent"], id="success"),
+        pytest.param("URGENT", [], True, ["urgent"], id="normalizes-case"),
+        pytest.param("work", ["work"], False, ["work"], id="duplicate"),
+        pytest.param("extra", ["work", "urgent", "personal"], False, ["work", "urgent", "personal"], id="max-limit"),
+        pytest.param("   ", [], False, [], id="empty-string"),
+    ])
+    def test_add_tag(self, make_task, tag_in, initial, expected_result, expected_tags):
+        """Test adding tags, including the rejected cases"""
+        task = make_task(tag=initial[0] if initial else "", tags=list(initial))
+
+        assert task.add_tag(tag_in) is expected_result
+        assert task.tags == expected_tags
+        # Legacy field stays synced with the first tag
+        assert task.tag == (expected_tags[0] if expected_tags else "")
+
+    @pytest.mark.parametrize("tag_out, initial, expected_result, expected_tags", [
+        pytest.param("urgent", ["work", "urgent"], True, ["work"], id="success"),
+        pytest.param("urgent", ["work"], False, ["work"], id="not-found"),
+        pytest.param("work", ["work"], True, [], id="last-tag-clears-legacy-field"),
+    ])
+    def test_remove_tag(self, make_task, tag_out, initial, expected_result, expected_tags):
+        """Test removing tags"""
+        task = make_task(tag=initial[0], tags=list(initial))
+
+        assert task.remove_tag(tag_out) is expected_result
+        assert task.tags == expected_tags
+        assert task.tag == (expected_tags[0] if expected_tags else "")
 
 
 class TestTagDisplay:
     """Test tag display formatting"""
 
-    def test_get_tags_display_multiple(self):
-        """Test displaying multiple tags"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work", "urgent", "personal"],
-        )
-
-        display = task.get_tags_display()
-        assert display == "work, urgent, personal"
-
-    def test_get_tags_display_single(self):
-        """Test displaying single tag"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="work",
-            tags=["work"],
-        )
-
-        display = task.get_tags_display()
-        assert display == "work"
-
-    def test_get_tags_display_empty(self):
-        """Test displaying no tags"""
-        task = Task(
-            id=1,
-            name="Task",
-            comment="",
-            description="",
-            priority=2,
-            tag="",
-            tags=[],
-        )
+    @pytest.mark.parametrize("tags, expected", [
+        pytest.param(["work", "urgent", "personal"], "work, urgent, personal", id="multiple"),
+        pytest.param(["work"], "work", id="single"),
+        pytest.param([], "", id="empty"),
+    ])
+    def test_get_tags_display(self, make_task, tags, expected):
+        """Test comma-separated tag display"""
+        task = make_task(tag=tags[0] if tags else "", tags=tags)
 
-        display = task.get_tags_display()
-        assert display == ""
+        assert task.get_tags_display() == expected
 
 
 class TestTaskEquality:
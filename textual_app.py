@@ -14,7 +14,7 @@ from textual.reactive import reactive
 from textual import work
 
 from core.state import AppState
-from core.commands import handle_command
+from core.commands import handle_command, route_add
 from core.suggestions import LocalSuggestions
 from textual_widgets.task_table import TaskTable
 from textual_widgets.note_table import NoteTable
@@ -965,6 +965,7 @@ class TodoTextualApp(App):
 
             if task.tags != old_tags:
                 self.state._update_tag_index_for_task(task, old_tags)
+            self.state.invalidate_filter_cache()
 
             # Refresh UI
             self.refresh_table()
@@ -1017,6 +1018,7 @@ class TodoTextualApp(App):
 
                 if task.tags != old_tags:
                     self.state._update_tag_index_for_task(task, old_tags)
+                self.state.invalidate_filter_cache()
 
                 # Refresh UI
                 self.refresh_table()
@@ -1029,7 +1031,7 @@ class TodoTextualApp(App):
         if task_id is not None:
             task = self.state.get_task_by_id(task_id)
             if task:
-                task.done = True
+                self.state.set_done(task, True)
                 self.refresh_table()
                 self.notify(f"Task #{task_id} marked as done", severity="information")
         else:
@@ -1042,7 +1044,7 @@ class TodoTextualApp(App):
         if task_id is not None:
             task = self.state.get_task_by_id(task_id)
             if task:
-                task.done = False
+                self.state.set_done(task, False)
                 self.refresh_table()
                 self.notify(f"Task #{task_id} marked as undone", severity="information")
         else:
@@ -1267,10 +1269,7 @@ class TodoTextualApp(App):
         - In notes mode: creates a new note (opens NoteEditorModal).
         - In tasks mode: opens TaskForm for new task (existing behavior).
         """
-        if getattr(self.state, 'entity_mode', 'tasks') == 'notes':
-            self.action_new_note()
-        else:
-            self.action_add_task()
+        route_add(self)
 
     def action_toggle_mode(self) -> None:
         """Toggle between tasks and notes mode"""
@@ -21,17 +21,22 @@ Examples:
     tag=psdc+webasto         → Tasks with both tags
 """
 
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import Callable, Iterable, List, Tuple, Optional
 import re
+import sys
 from utils.time import parse_duration
 
 
 class FilterCondition:
     """Represents a single filter condition"""
 
+    __slots__ = ('field', 'operator', 'value', 'values')
+
     def __init__(self, field: str, operator: str, value: str):
-        self.field = field.lower()
-        self.operator = operator
+        # Interned: every condition shares one str per field/operator name
+        self.field = sys.intern(field.lower())
+        self.operator = sys.intern(operator)
         self.value = value.lower()
 
         # Parse multi-value (comma-separated OR logic)
@@ -44,6 +49,20 @@ class FilterCondition:
         return f"FilterCondition({self.field} {self.operator} {self.value})"
 
 
+# One C-level scan per condition: letters-only field, the first operator
+# after it (two-char operators tried first), then a non-empty value
+_CONDITION_RE = re.compile(r'\s*([A-Za-z]+)\s*(!=|>=|<=|=)\s*(.*?)\s*', re.DOTALL)
+
+# Accepted field names and aliases -> canonical field (one probe both
+# resolves the alias and validates the field)
+_FIELD_NAMES = {
+    'priority': 'priority', 'prio': 'priority', 'pri': 'priority', 'p': 'priority',
+    'status': 'status', 'stat': 'status', 's': 'status',
+    'tag': 'tag', 't': 'tag',
+    'age': 'age',
+}
+
+
 def parse_filter_expression(filter_str: str) -> List[FilterCondition]:
     """
     Parse filter expression into list of conditions.
@@ -52,12 +71,23 @@ def parse_filter_expression(filter_str: str) -> List[FilterCondition]:
         filter_str: Filter expression like "status=done tag=psdc priority>=2"
 
     Returns:
-        List of FilterCondition objects
+        List of FilterCondition objects (cached per expression string, so
+        the conditions are shared between calls - treat them as read-only)
 
     Examples:
         >>> parse_filter_expression("status=done tag=psdc")
         [FilterCondition(status = done), FilterCondition(tag = psdc)]
     """
+    return list(_parse_filter_expression_cached(filter_str))
+
+
+@lru_cache(maxsize=256)
+def _parse_filter_expression_cached(filter_str: str) -> Tuple[FilterCondition, ...]:
+    # The UI re-parses the same expression on every render/status refresh
+    return tuple(_parse_filter_expression_uncached(filter_str))
+
+
+def _parse_filter_expression_uncached(filter_str: str) -> List[FilterCondition]:
     if not filter_str or filter_str.strip() == "":
         return []
 
@@ -104,35 +134,19 @@ def parse_condition(condition_str: str) -> Optional[FilterCondition]:
     Returns:
         FilterCondition object or None if invalid
     """
-    # Try to match operators in order of precedence (longest first)
-    operators = ['!=', '>=', '<=', '=']
-
-    for op in operators:
-        if op in condition_str:
-            parts = condition_str.split(op, 1)
-            if len(parts) == 2:
-                field = parts[0].strip().lower()
-                value = parts[1].strip()
-
-                # Normalize field aliases
-                field_aliases = {
-                    'prio': 'priority', 'pri': 'priority', 'p': 'priority',
-                    'stat': 'status', 's': 'status',
-                    't': 'tag'
-                }
-                field = field_aliases.get(field, field)
-
-                # Validate field
-                if field not in ('status', 'priority', 'tag', 'age'):
-                    continue
-
-                # Validate value
-                if not value:
-                    continue
-
-                return FilterCondition(field, op, value)
+    match = _CONDITION_RE.fullmatch(condition_str)
+    if match is None:
+        return None
+    field, op, value = match.groups()
+    if not value:
+        return None
 
-    return None
+    # Normalize field aliases and validate field
+    field = _FIELD_NAMES.get(field.lower())
+    if field is None:
+        return None
+
+    return FilterCondition(field, op, value)
 
 
 def matches_condition(task, condition: FilterCondition) -> bool:
@@ -146,20 +160,10 @@ def matches_condition(task, condition: FilterCondition) -> bool:
     Returns:
         True if task matches condition
     """
-    field = condition.field
-    operator = condition.operator
-    value = condition.value
-
-    if field == 'status':
-        return match_status(task, operator, value)
-    elif field == 'priority':
-        return match_priority(task, operator, value)
-    elif field == 'tag':
-        return match_tag(task, operator, value)
-    elif field == 'age':
-        return match_age(task, operator, value)
-
-    return False
+    matcher = _MATCHERS.get(condition.field)
+    if matcher is None:
+        return False
+    return matcher(task, condition.operator, condition.value)
 
 
 def match_status(task, operator: str, value: str) -> bool:
@@ -183,32 +187,21 @@ def match_status(task, operator: str, value: str) -> bool:
 def match_priority(task, operator: str, value: str) -> bool:
     """Match priority condition with operators"""
     task_priority = getattr(task, 'priority', 2)
-
-    # Helper: convert textual priority to numeric
-    def to_pri(v: str) -> Optional[int]:
-        v = v.strip().lower()
-        mapping = {
-            '1': 1, 'high': 1, 'h': 1,
-            '2': 2, 'medium': 2, 'med': 2, 'm': 2,
-            '3': 3, 'low': 3, 'l': 3,
-        }
-        return mapping.get(v)
+    targets = _priority_targets(value)
+    if targets is None:
+        return False
 
     # Handle multi-value (comma-separated OR)
     if ',' in value:
-        values = [to_pri(v) for v in value.split(',')]
-        values = [v for v in values if v is not None]
         # For multi-value, only = and != make sense
         if operator == '=':
-            return task_priority in values
+            return task_priority in targets
         elif operator == '!=':
-            return task_priority not in values
+            return task_priority not in targets
         return False
 
     # Single value comparison
-    target_priority = to_pri(value)
-    if target_priority is None:
-        return False
+    (target_priority,) = targets
 
     if operator == '=':
         return task_priority == target_priority
@@ -222,6 +215,31 @@ def match_priority(task, operator: str, value: str) -> bool:
     return False
 
 
+# Textual/numeric priority names -> numeric priority
+_PRIORITY_VALUES = {
+    '1': 1, 'high': 1, 'h': 1,
+    '2': 2, 'medium': 2, 'med': 2, 'm': 2,
+    '3': 3, 'low': 3, 'l': 3,
+}
+
+
+@lru_cache(maxsize=64)
+def _priority_targets(value: str) -> Optional[frozenset]:
+    """
+    Numeric priorities named by a filter value ("1", "high", "1,m").
+
+    Parsed once per distinct value rather than once per task. Unknown names
+    are dropped from comma lists; an unknown single value gives None.
+    """
+    if ',' in value:
+        return frozenset(
+            p for p in (_PRIORITY_VALUES.get(v.strip().lower()) for v in value.split(','))
+            if p is not None
+        )
+    target = _PRIORITY_VALUES.get(value.strip().lower())
+    return None if target is None else frozenset((target,))
+
+
 def match_age(task, operator: str, value: str) -> bool:
     """Match age condition using created_at timestamp.
 
@@ -293,6 +311,16 @@ def match_tag(task, operator: str, value: str) -> bool:
     return False
 
 
+# Field -> matcher, so matches_condition does one dict probe instead of an
+# if/elif chain of string compares per task
+_MATCHERS = {
+    'status': match_status,
+    'priority': match_priority,
+    'tag': match_tag,
+    'age': match_age,
+}
+
+
 def matches_all_conditions(task, conditions: List[FilterCondition]) -> bool:
     """
     Check if task matches ALL conditions (AND logic).
@@ -314,6 +342,189 @@ def matches_all_conditions(task, conditions: List[FilterCondition]) -> bool:
     return True
 
 
+def compile_filter(conditions: List[FilterCondition]) -> Callable[[object], bool]:
+    """
+    Compile conditions into a single predicate (AND logic).
+
+    Field/operator dispatch and value parsing happen once here instead of
+    once per task, so filtering N tasks only runs the per-task checks.
+    Checks run cheapest/most selective first (see _condition_rank); since
+    they are ANDed, results are identical to matches_all_conditions().
+
+    Args:
+        conditions: List of FilterCondition objects
+
+    Returns:
+        Callable taking a task and returning True if it matches
+    """
+    ordered = sorted(conditions, key=_condition_rank)
+    predicates = tuple(_compile_condition(c) for c in ordered)
+    if not predicates:
+        return lambda task: True
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def match_all(task) -> bool:
+        for predicate in predicates:
+            if not predicate(task):
+                return False
+        return True
+
+    return match_all
+
+
+def filter_tasks(tasks: Iterable, filter_str: str) -> list:
+    """
+    Return tasks matching a filter expression, preserving order.
+
+    Args:
+        tasks: Task objects to filter
+        filter_str: Filter expression like "status=done tag=psdc"
+
+    Returns:
+        List of matching tasks
+    """
+    match = compile_filter(parse_filter_expression(filter_str))
+    return [t for t in tasks if match(t)]
+
+
+def _condition_rank(condition: FilterCondition) -> int:
+    """
+    Evaluation order for compiled conditions (lower runs first).
+
+    Priority/status equality are one attribute compare and usually cut the
+    most tasks; tag checks walk the task's tags; age parses a timestamp per
+    task, so it always runs last.
+    """
+    field = condition.field
+    if field == 'age':
+        return 5
+    if condition.operator != '=':
+        return 4
+    if field == 'priority':
+        return 0
+    if field == 'status':
+        return 1
+    if field == 'tag' and '+' in condition.value:
+        return 2
+    return 3
+
+
+def _never(task) -> bool:
+    return False
+
+
+def _compile_condition(condition: FilterCondition) -> Callable[[object], bool]:
+    """Build the predicate for one condition (see matches_condition)."""
+    compiler = _COMPILERS.get(condition.field)
+    if compiler is None:
+        return _never
+    return compiler(condition.operator, condition.value)
+
+
+def _compile_status(operator: str, value: str) -> Callable[[object], bool]:
+    """Predicate equivalent to match_status(task, operator, value)."""
+    if operator not in ('=', '!='):
+        return _never
+    if value == 'done':
+        want_done = operator == '='
+    elif value == 'undone':
+        want_done = operator == '!='
+    else:
+        return _never
+    if want_done:
+        return lambda task: bool(getattr(task, 'done', False))
+    return lambda task: not getattr(task, 'done', False)
+
+
+def _compile_priority(operator: str, value: str) -> Callable[[object], bool]:
+    """Predicate equivalent to match_priority(task, operator, value)."""
+    targets = _priority_targets(value)
+    if targets is None:
+        return _never
+
+    if ',' in value:
+        if operator == '=':
+            return lambda task: getattr(task, 'priority', 2) in targets
+        if operator == '!=':
+            return lambda task: getattr(task, 'priority', 2) not in targets
+        return _never
+
+    (target,) = targets
+    if operator == '=':
+        return lambda task: getattr(task, 'priority', 2) == target
+    if operator == '!=':
+        return lambda task: getattr(task, 'priority', 2) != target
+    if operator == '>=':
+        return lambda task: getattr(task, 'priority', 2) >= target
+    if operator == '<=':
+        return lambda task: getattr(task, 'priority', 2) <= target
+    return _never
+
+
+def _compile_tag(operator: str, value: str) -> Callable[[object], bool]:
+    """Predicate equivalent to match_tag(task, operator, value)."""
+    if operator not in ('=', '!='):
+        return _never
+    negate = operator == '!='
+    # Tag sets are built once here; per task the tags are lowercased lazily
+    # via map() so no intermediate list is allocated
+    lower = str.lower
+
+    if '+' in value:
+        # Must have ALL tags
+        required = frozenset(t.strip() for t in value.split('+'))
+
+        def has_tags(task) -> bool:
+            return required.issubset(map(lower, getattr(task, 'tags', ())))
+    elif ',' in value:
+        # Has ANY of the tags
+        possible = frozenset(t.strip() for t in value.split(','))
+
+        def has_tags(task) -> bool:
+            return not possible.isdisjoint(map(lower, getattr(task, 'tags', ())))
+    else:
+        target = value.strip()
+
+        def has_tags(task) -> bool:
+            return target in map(lower, getattr(task, 'tags', ()))
+
+    if negate:
+        return lambda task: not has_tags(task)
+    return has_tags
+
+
+def _compile_age(operator: str, value: str) -> Callable[[object], bool]:
+    """Predicate equivalent to match_age(task, operator, value)."""
+    from utils.time import age_seconds
+
+    target = parse_duration(value)
+    if target is None or operator not in ('=', '!=', '>=', '<='):
+        return _never
+
+    def match(task) -> bool:
+        task_age = age_seconds(getattr(task, 'created_at', ''))
+        if task_age is None:
+            return False
+        if operator == '=':
+            return task_age == target
+        if operator == '!=':
+            return task_age != target
+        if operator == '>=':
+            return task_age >= target
+        return task_age <= target
+
+    return match
+
+
+_COMPILERS = {
+    'status': _compile_status,
+    'priority': _compile_priority,
+    'tag': _compile_tag,
+    'age': _compile_age,
+}
+
+
 def get_filter_description(conditions: List[FilterCondition]) -> str:
     """
     Get human-readable description of filter.
@@ -327,55 +538,64 @@ def get_filter_description(conditions: List[FilterCondition]) -> str:
     if not conditions:
         return "none"
 
-    parts = []
-    for condition in conditions:
-        field = condition.field
-        op = condition.operator
-        value = condition.value
-
-        if field == 'status':
-            if op == '=' and value == 'done':
-                parts.append("completed")
-            elif op == '=' and value == 'undone':
-                parts.append("incomplete")
-            elif op == '!=' and value == 'done':
-                parts.append("not completed")
-            elif op == '!=' and value == 'undone':
-                parts.append("not incomplete")
-
-        elif field == 'priority':
-            if op == '=':
-                if ',' in value:
-                    # Map textual values to human words if possible
-                    names_map = {
-                        '1': 'high', 'high': 'high', 'h': 'high',
-                        '2': 'medium', 'medium': 'medium', 'med': 'medium', 'm': 'medium',
-                        '3': 'low', 'low': 'low', 'l': 'low',
-                    }
-                    pretty = ','.join(names_map.get(v.strip().lower(), v.strip()) for v in value.split(','))
-                    parts.append(f"priority {pretty}")
-                else:
-                    priority_names = {1: "high", 2: "medium", 3: "low"}
-                    try:
-                        num = int(value)
-                        parts.append(f"{priority_names.get(num, value)} priority")
-                    except ValueError:
-                        parts.append(f"{value} priority")
-            elif op == '!=':
-                parts.append(f"not priority {value}")
-            elif op == '>=':
-                parts.append(f"priority >= {value}")
-            elif op == '<=':
-                parts.append(f"priority <= {value}")
-
-        elif field == 'tag':
-            if '+' in value:
-                parts.append(f"tags {value.replace('+', ' AND ')}")
-            elif ',' in value:
-                parts.append(f"tags {value.replace(',', ' OR ')}")
-            elif op == '=':
-                parts.append(f"tagged {value}")
-            elif op == '!=':
-                parts.append(f"not tagged {value}")
-
-    return ", ".join(parts)
+    return ", ".join(filter(None, map(_describe_condition, conditions)))
+
+
+_STATUS_DESCRIPTIONS = {
+    ('=', 'done'): "completed",
+    ('=', 'undone'): "incomplete",
+    ('!=', 'done'): "not completed",
+    ('!=', 'undone'): "not incomplete",
+}
+
+_PRIORITY_WORDS = {
+    '1': 'high', 'high': 'high', 'h': 'high',
+    '2': 'medium', 'medium': 'medium', 'med': 'medium', 'm': 'medium',
+    '3': 'low', 'low': 'low', 'l': 'low',
+}
+
+_PRIORITY_NUMBER_WORDS = {1: "high", 2: "medium", 3: "low"}
+
+_PRIORITY_COMPARISONS = {
+    '!=': "not priority {}",
+    '>=': "priority >= {}",
+    '<=': "priority <= {}",
+}
+
+
+def _describe_condition(condition: FilterCondition) -> Optional[str]:
+    """Phrase for one condition, or None if it has no description."""
+    field = condition.field
+    op = condition.operator
+    value = condition.value
+
+    if field == 'status':
+        return _STATUS_DESCRIPTIONS.get((op, value))
+
+    if field == 'priority':
+        if op != '=':
+            template = _PRIORITY_COMPARISONS.get(op)
+            return template.format(value) if template else None
+        if ',' in value:
+            # Map textual values to human words if possible
+            pretty = ','.join(
+                _PRIORITY_WORDS.get(v.strip().lower(), v.strip()) for v in value.split(',')
+            )
+            return f"priority {pretty}"
+        try:
+            num = int(value)
+        except ValueError:
+            return f"{value} priority"
+        return f"{_PRIORITY_NUMBER_WORDS.get(num, value)} priority"
+
+    if field == 'tag':
+        if '+' in value:
+            return f"tags {value.replace('+', ' AND ')}"
+        if ',' in value:
+            return f"tags {value.replace(',', ' OR ')}"
+        if op == '=':
+            return f"tagged {value}"
+        if op == '!=':
+            return f"not tagged {value}"
+
+    return None
@@ -8,6 +8,10 @@ from typing import List, Optional, Callable
 from config import validation
 
 
+# Only allow: letters, numbers, hyphens, underscores
+_TAG_RE = re.compile(r'^[a-z0-9_-]+$')
+
+
 def validate_tag_format(tag: str) -> bool:
     """
     Validate tag format.
@@ -33,8 +37,7 @@ def validate_tag_format(tag: str) -> bool:
     if len(tag) < validation.MIN_TAG_LENGTH or len(tag) > validation.MAX_TAG_LENGTH:
         return False
 
-    # Only allow: letters, numbers, hyphens, underscores
-    return bool(re.match(r'^[a-z0-9_-]+$', tag))
+    return _TAG_RE.match(tag) is not None
 
 
 def normalize_tag(tag: str) -> str:
@@ -88,12 +91,17 @@ def parse_tags(
     if not tag_str:
         return []
 
-    # Split by comma if present
-    if ',' in tag_str:
-        raw_tags = tag_str.split(',')
-    else:
-        # Single tag
-        raw_tags = [tag_str]
+    # A string without commas splits into a single tag
+    raw_tags = tag_str.split(',')
+
+    if warn_callback is None and max_tags > 0:
+        # Nothing to report: keep the first max_tags unique valid tags in a
+        # single pass (dict.fromkeys dedups while preserving order)
+        valid = (
+            tag for tag in map(normalize_tag, raw_tags)
+            if tag and validate_tag_format(tag)
+        )
+        return list(dict.fromkeys(valid))[:max_tags]
 
     # Normalize and validate
     normalized = []
@@ -127,7 +135,7 @@ def parse_tags(
         # Respect max limit
         if len(normalized) >= max_tags:
             # Warn about dropped tags
-            remaining = len([t for t in raw_tags[idx+1:] if normalize_tag(t)])
+            remaining = sum(1 for t in raw_tags[idx+1:] if t.strip())
             if remaining > 0 and warn_callback:
                 warn_callback(
                     f"[yellow]⚠ Tag limit reached ({max_tags} max), "